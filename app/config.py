@@ -2,6 +2,9 @@ import os
 import logging
 import json
 
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
 logging.basicConfig()
 logging.getLogger().setLevel(logging.INFO)
 
@@ -37,11 +40,70 @@ except Exception as exc:
     logging.getLogger().error(f"Error parsing IRI_API_PARAMS: {exc}")
 
 
-API_URL_ROOT = os.environ.get("API_URL_ROOT", "https://api.iri.nersc.gov")
-API_PREFIX = os.environ.get("API_PREFIX", "/")
-API_URL = os.environ.get("API_URL", "api/v1")
+class Settings(BaseSettings):
+    """Deployment settings, read (and validated) once from the environment variables of the same name."""
+    model_config = SettingsConfigDict(frozen=True)
+
+    api_url_root: str = "https://api.iri.nersc.gov"
+    api_prefix: str = "/"
+    api_url: str = "api/v1"
+
+    opentelemetry_enabled: bool = False
+    opentelemetry_debug: bool = False
+    otlp_endpoint: str = ""
+    otel_sample_rate: float = Field(default=0.2, ge=0.0, le=1.0)
+
+    # cache of the rendered bodies of unauthenticated endpoints (facility, sites, capabilities, status lists)
+    # kept in process, or in redis (shared by all workers) when redis_url is set
+    response_cache_enabled: bool = True
+    response_cache_ttl: float = Field(default=60, ge=0)
+    response_cache_ttl_short: float = Field(default=10, ge=0)
+    response_cache_ttl_long: float = Field(default=600, ge=0)
+    # seconds an expired entry is still served (stale-while-revalidate) while it's refreshed in the background,
+    # capped at half the ttl of the entry's cache policy
+    response_cache_stale_ttl: float = Field(default=60, ge=0)
+    # serve an expired entry (for up to response_cache_fallback_ttl seconds) when the adapter fails
+    iri_cache_fallback: bool = False
+    response_cache_fallback_ttl: float = Field(default=86400, ge=0)
+    response_cache_maxsize: int = Field(default=1024, ge=1)
+    redis_url: str = ""
+
+    # conditional GET (ETag from id + last_modified, 304 on If-None-Match) of single status objects,
+    # only correct if the adapter updates last_modified whenever an object changes
+    conditional_get_enabled: bool = False
+    conditional_get_max_age: int = Field(default=10, ge=0)
+
+    # seconds a task command may run before it is cancelled and the task failed,
+    # the commands moving file contents around (download, upload, cp, mv, compress, extract, rm) get the long one
+    task_timeout: float = Field(default=30, gt=0)
+    task_timeout_long: float = Field(default=600, gt=0)
+
+
+settings = Settings()
+
+API_URL_ROOT = settings.api_url_root
+API_PREFIX = settings.api_prefix
+API_URL = settings.api_url
+# the root of every link returned by the api, built once
+API_BASE_URL = f"{API_URL_ROOT}{API_PREFIX}{API_URL}"
+
+OPENTELEMETRY_ENABLED = settings.opentelemetry_enabled
+OPENTELEMETRY_DEBUG = settings.opentelemetry_debug
+OTLP_ENDPOINT = settings.otlp_endpoint
+OTEL_SAMPLE_RATE = settings.otel_sample_rate
+
+RESPONSE_CACHE_ENABLED = settings.response_cache_enabled
+RESPONSE_CACHE_TTL = settings.response_cache_ttl
+RESPONSE_CACHE_TTL_SHORT = settings.response_cache_ttl_short
+RESPONSE_CACHE_TTL_LONG = settings.response_cache_ttl_long
+RESPONSE_CACHE_STALE_TTL = settings.response_cache_stale_ttl
+CACHE_FALLBACK = settings.iri_cache_fallback
+RESPONSE_CACHE_FALLBACK_TTL = settings.response_cache_fallback_ttl
+RESPONSE_CACHE_MAXSIZE = settings.response_cache_maxsize
+REDIS_URL = settings.redis_url
+
+CONDITIONAL_GET_ENABLED = settings.conditional_get_enabled
+CONDITIONAL_GET_MAX_AGE = settings.conditional_get_max_age
 
-OPENTELEMETRY_ENABLED = os.environ.get("OPENTELEMETRY_ENABLED", "false").lower() == "true"
-OPENTELEMETRY_DEBUG = os.environ.get("OPENTELEMETRY_DEBUG", "false").lower() == "true"
-OTLP_ENDPOINT = os.environ.get("OTLP_ENDPOINT", "")
-OTEL_SAMPLE_RATE = float(os.environ.get("OTEL_SAMPLE_RATE", "0.2"))
+TASK_TIMEOUT = settings.task_timeout
+TASK_TIMEOUT_LONG = settings.task_timeout_long
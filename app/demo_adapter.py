@@ -1,7 +1,9 @@
 import base64
+import collections
 import datetime
 import glob
 import grp
+import itertools
 import os
 import pathlib
 import pwd
@@ -12,12 +14,13 @@ import uuid
 from typing import Any, Tuple
 
 from fastapi import HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from .routers.account import facility_adapter as account_adapter
 from .routers.account import models as account_models
 from .routers.compute import facility_adapter as compute_adapter
 from .routers.compute import models as compute_models
+from .routers.error_handlers import NotFound
 from .routers.facility import facility_adapter
 from .routers.facility import models as facility_models
 from .routers.filesystem import facility_adapter as filesystem_adapter
@@ -26,18 +29,20 @@ from .routers.status import facility_adapter as status_adapter
 from .routers.status import models as status_models
 from .routers.task import facility_adapter as task_adapter
 from .routers.task import models as task_models
+from .types.base import IndexedCollection
 from .types.models import Capability
 from .types.scalars import AllocationUnit
 
 DEMO_QUEUE_UPDATE_SECS = 5
 
-def paginate_list(items, offset: int | None, limit: int | None):
-    """Return a sliced items using offset and limit."""
-    if offset is not None and offset > 0:
-        items = items[offset:]
-    if limit is not None and limit >= 0:
-        items = items[:limit]
-    return items
+# parses the queued (json) task commands back into their typed command model
+_TASK_COMMAND = TypeAdapter(task_models.TaskCommand)
+
+def paginate_list(items, offset: int | None, limit: int | None) -> list:
+    """Return the items (any iterable) in offset..offset+limit, consuming no more of them than needed."""
+    start = offset if offset is not None and offset > 0 else 0
+    stop = start + limit if limit is not None and limit >= 0 else None
+    return list(itertools.islice(items, start, stop))
 
 class PathSandbox:
     _base_temp_dir = None
@@ -105,7 +110,7 @@ class DemoAdapter(status_adapter.FacilityAdapter, account_adapter.FacilityAdapte
             state_or_province_name="DC",
             latitude=36.173357,
             longitude=-234.51452,
-            resource_uris=[])
+            resource_ids=[])
 
         site2 = facility_models.Site(
             id=demo_uuid("site", "demo_site_2"),
@@ -119,7 +124,7 @@ class DemoAdapter(status_adapter.FacilityAdapter, account_adapter.FacilityAdapte
             state_or_province_name="ET",
             latitude=38.410558,
             longitude=-286.36999,
-            resource_uris=[])
+            resource_ids=[])
 
         self.facility = facility_models.Facility(
             id=demo_uuid("facility", "demo_facility"),
@@ -129,7 +134,7 @@ class DemoAdapter(status_adapter.FacilityAdapter, account_adapter.FacilityAdapte
             short_name="DEMO",
             organization_name="Demo Organization",
             support_uri="https://support.demo.example",
-            site_uris=[site1.self_uri, site2.self_uri]
+            site_ids=[site1.id, site2.id]
         )
 
         self.sites = [site1, site2]
@@ -137,10 +142,10 @@ class DemoAdapter(status_adapter.FacilityAdapter, account_adapter.FacilityAdapte
 
         day_ago = utc_now() - datetime.timedelta(days=1)
         self.capabilities = {
-            "cpu": Capability(id=str(uuid.uuid4()), name="CPU Nodes", units=[AllocationUnit.node_hours]),
-            "gpu": Capability(id=str(uuid.uuid4()), name="GPU Nodes", units=[AllocationUnit.node_hours]),
-            "hpss": Capability(id=str(uuid.uuid4()), name="Tape Storage", units=[AllocationUnit.bytes, AllocationUnit.inodes]),
-            "gpfs": Capability(id=str(uuid.uuid4()), name="GPFS Storage", units=[AllocationUnit.bytes, AllocationUnit.inodes]),
+            "cpu": Capability(id=str(uuid.uuid4()), name="CPU Nodes", units=[AllocationUnit.node_hours], last_modified=day_ago),
+            "gpu": Capability(id=str(uuid.uuid4()), name="GPU Nodes", units=[AllocationUnit.node_hours], last_modified=day_ago),
+            "hpss": Capability(id=str(uuid.uuid4()), name="Tape Storage", units=[AllocationUnit.bytes, AllocationUnit.inodes], last_modified=day_ago),
+            "gpfs": Capability(id=str(uuid.uuid4()), name="GPFS Storage", units=[AllocationUnit.bytes, AllocationUnit.inodes], last_modified=day_ago),
         }
 
         pm = status_models.Resource(id=str(uuid.uuid4()), site_id=site1.id, group="perlmutter", name="compute nodes", description="the perlmutter computer compute nodes",
@@ -216,6 +221,17 @@ class DemoAdapter(status_adapter.FacilityAdapter, account_adapter.FacilityAdapte
                     )
                 )
 
+        self.capabilities_by_id = {c.id: c for c in self.capabilities.values()}
+        self.projects_by_id = {p.id: p for p in self.projects}
+        self.project_allocations_by_id = {pa.id: pa for pa in self.project_allocations}
+        self.user_allocations_by_id = {ua.id: ua for ua in self.user_allocations}
+        self.project_allocations_by_project = collections.defaultdict(list)
+        for pa in self.project_allocations:
+            self.project_allocations_by_project[pa.project_id].append(pa)
+        self.user_allocations_by_project_allocation = collections.defaultdict(list)
+        for ua in self.user_allocations:
+            self.user_allocations_by_project_allocation[ua.project_allocation_id].append(ua)
+
         statuses = { r.name: status_models.Status.up for r in self.resources }
         last_incidents = {}
         d = datetime.datetime(2025, 3, 1, 10, 0, 0, tzinfo=datetime.timezone.utc)
@@ -269,54 +285,57 @@ class DemoAdapter(status_adapter.FacilityAdapter, account_adapter.FacilityAdapte
 
             d += datetime.timedelta(minutes=int(random.random() * 15 + 1))
 
+        # index the collections searched by the status api (they don't change from here on)
+        self.resources = IndexedCollection(self.resources, ("name", "group", "resource_type", "current_status", "site_id"))
+        self.events = IndexedCollection(self.events, ("name", "resource_id", "status", "incident_id"))
+        self.incidents = IndexedCollection(self.incidents, ("name", "type", "status", "resolution"), multi_indexed=("resource_ids",))
+
     # ----------------------------
     # Facility API
     # ----------------------------
 
     async def get_facility(
         self: "DemoAdapter",
-        modified_since: str | None = None
+        modified_since: datetime.datetime | None = None
         ) -> facility_models.Facility:
         return self.facility
 
 
     async def list_sites(
         self: "DemoAdapter",
-        modified_since: str | None = None,
+        modified_since: datetime.datetime | None = None,
         name: str | None = None,
         offset: int | None = None,
         limit: int | None = None,
         short_name: str | None = None
         ) -> list[facility_models.Site]:
-        sites = self.sites
+        # chain lazy filters, so paginate_list stops as soon as the page is full
+        sites = iter(self.sites)
 
         if name:
-            sites = [s for s in sites if name.lower() in s.name.lower()]
+            needle = name.lower()
+            sites = (s for s in sites if needle in s.name.lower())
 
         if short_name:
-            sites = [s for s in sites if s.short_name == short_name]
+            sites = (s for s in sites if s.short_name == short_name)
 
         if modified_since:
-            ms = datetime.datetime.fromisoformat(str(modified_since))
-            sites = [s for s in sites if s.last_modified > ms]
+            sites = (s for s in sites if s.last_modified > modified_since)
 
-        o = offset or 0
-        l = limit or len(sites)
-        return sites[o:o+l]
+        return paginate_list(sites, offset, limit)
 
 
     async def get_site(
         self: "DemoAdapter",
         site_id: str,
-        modified_since: str | None = None
+        modified_since: datetime.datetime | None = None
         ) -> facility_models.Site:
         site = next((s for s in self.sites if s.id == site_id), None)
         if not site:
             raise HTTPException(status_code=404, detail="Site not found")
 
         if modified_since:
-            ms = datetime.datetime.fromisoformat(str(modified_since))
-            if site.last_modified <= ms:
+            if site.last_modified <= modified_since:
                 raise HTTPException(status_code=304, headers={"Last-Modified": site.last_modified.isoformat()})
 
         return site
@@ -348,7 +367,10 @@ class DemoAdapter(status_adapter.FacilityAdapter, account_adapter.FacilityAdapte
         self : "DemoAdapter",
         id_ : str
         ) -> status_models.Resource:
-        return status_models.Resource.find_by_id(self.resources, id_)
+        resource = status_models.Resource.find_by_id(self.resources, id_)
+        if resource is None:
+            raise NotFound(f"Resource {id_} not found")
+        return resource
 
     async def get_events(
         self : "DemoAdapter",
@@ -364,7 +386,7 @@ class DemoAdapter(status_adapter.FacilityAdapter, account_adapter.FacilityAdapte
         time_ : datetime.datetime | None = None,
         modified_since : datetime.datetime | None = None
         ) -> list[status_models.Event]:
-        events = status_models.Event.find([e for e in self.events if e.incident_id == incident_id], resource_id=resource_id, name=name, description=description,
+        events = status_models.Event.find(self.events.select(incident_id=incident_id), resource_id=resource_id, name=name, description=description,
                                           status=status, from_=from_, to=to, time_=time_, modified_since=modified_since)
         return paginate_list(events, offset, limit)
 
@@ -374,7 +396,10 @@ class DemoAdapter(status_adapter.FacilityAdapter, account_adapter.FacilityAdapte
         incident_id : str,
         id_ : str
         ) -> status_models.Event:
-        return status_models.Event.find_by_id(self.events, id_)
+        event = status_models.Event.find_by_id(self.events, id_)
+        if event is None:
+            raise NotFound(f"Event {id_} not found")
+        return event
 
 
     async def get_incidents(
@@ -401,17 +426,32 @@ class DemoAdapter(status_adapter.FacilityAdapter, account_adapter.FacilityAdapte
         self : "DemoAdapter",
         id_ : str
         ) -> status_models.Incident:
-        return status_models.Incident.find_by_id(self.incidents, id_)
+        incident = status_models.Incident.find_by_id(self.incidents, id_)
+        if incident is None:
+            raise NotFound(f"Incident {id_} not found")
+        return incident
 
 
     async def get_capabilities(
         self : "DemoAdapter",
         name : str | None = None,
-        modified_since : str | None = None,
+        modified_since : datetime.datetime | None = None,
         offset : int = 0,
         limit : int = 1000
         ) -> list[Capability]:
-        return self.capabilities.values()
+        caps = Capability.find(list(self.capabilities.values()), name=name, modified_since=modified_since)
+        return paginate_list(caps, offset, limit)
+
+
+    async def get_capability(
+        self : "DemoAdapter",
+        capability_id : str,
+        modified_since : datetime.datetime | None = None
+        ) -> Capability | None:
+        cap = self.capabilities_by_id.get(capability_id)
+        if cap and modified_since and cap.last_modified <= modified_since:
+            raise HTTPException(status_code=304, headers={"Last-Modified": cap.last_modified.isoformat()})
+        return cap
 
 
     async def get_current_user(
@@ -446,12 +486,30 @@ class DemoAdapter(status_adapter.FacilityAdapter, account_adapter.FacilityAdapte
         return self.projects
 
 
+    async def get_project(
+            self : "DemoAdapter",
+            user: account_models.User,
+            project_id: str
+            ) -> account_models.Project | None:
+        return self.projects_by_id.get(project_id)
+
+
     async def get_project_allocations(
         self : "DemoAdapter",
         project: account_models.Project,
         user: account_models.User,
         ) -> list[account_models.ProjectAllocation]:
-        return [pa for pa in self.project_allocations if pa.project_id == project.id]
+        return self.project_allocations_by_project.get(project.id, [])
+
+
+    async def get_project_allocation(
+        self : "DemoAdapter",
+        project: account_models.Project,
+        user: account_models.User,
+        project_allocation_id: str
+        ) -> account_models.ProjectAllocation | None:
+        pa = self.project_allocations_by_id.get(project_allocation_id)
+        return pa if pa and pa.project_id == project.id else None
 
 
     async def get_user_allocations(
@@ -459,7 +517,17 @@ class DemoAdapter(status_adapter.FacilityAdapter, account_adapter.FacilityAdapte
         user: account_models.User,
         project_allocation: account_models.ProjectAllocation,
         ) -> list[account_models.UserAllocation]:
-        return [ua for ua in self.user_allocations if ua.project_allocation_id == project_allocation.id]
+        return self.user_allocations_by_project_allocation.get(project_allocation.id, [])
+
+
+    async def get_user_allocation(
+        self : "DemoAdapter",
+        user: account_models.User,
+        project_allocation: account_models.ProjectAllocation,
+        user_allocation_id: str
+        ) -> account_models.UserAllocation | None:
+        ua = self.user_allocations_by_id.get(user_allocation_id)
+        return ua if ua and ua.project_allocation_id == project_allocation.id else None
 
 
     async def submit_job(
@@ -718,7 +786,7 @@ class DemoAdapter(status_adapter.FacilityAdapter, account_adapter.FacilityAdapte
         path: str,
         file_bytes: int | None,
         lines: int | None,
-        skip_trailing: bool
+        skip_heading: bool
     ) -> Tuple[Any, int]:
         return self._headtail("tail", path, file_bytes, lines)
 
@@ -859,11 +927,11 @@ class DemoAdapter(status_adapter.FacilityAdapter, account_adapter.FacilityAdapte
         user: account_models.User,
         path: str
     ) -> Any:
-        rp = self.validate_path(path)
-        raw_content = pathlib.Path(rp).read_bytes()
-
-        if len(raw_content) > filesystem_adapter.OPS_SIZE_LIMIT:
+        rp = pathlib.Path(self.validate_path(path))
+        # check the size before reading, so an oversized file is never loaded
+        if rp.stat().st_size > filesystem_adapter.OPS_SIZE_LIMIT:
             raise Exception("File to download is too large.")
+        raw_content = rp.read_bytes()
 
         return base64.b64encode(raw_content).decode('utf-8')
 
@@ -984,7 +1052,10 @@ class DemoAdapter(status_adapter.FacilityAdapter, account_adapter.FacilityAdapte
         task_id: str
         ) -> task_models.Task|None:
         await DemoTaskQueue._process_tasks(self)
-        return next((t for t in DemoTaskQueue.tasks if t.user.name == user.name and t.id == task_id), None)
+        task = next((t for t in DemoTaskQueue.tasks if t.user.name == user.name and t.id == task_id), None)
+        if task is None:
+            raise NotFound(f"Task {task_id} not found")
+        return task
 
 
     async def get_tasks(
@@ -1029,7 +1100,7 @@ class DemoTaskQueue:
                 t.status = task_models.TaskStatus.active
                 t.start = now
             elif t.status == task_models.TaskStatus.active and now - t.start > DEMO_QUEUE_UPDATE_SECS:
-                cmd = task_models.TaskCommand.model_validate_json(t.task)
+                cmd = _TASK_COMMAND.validate_json(t.task)
                 (result, status) = await DemoAdapter.on_task(t.resource, t.user, cmd)
                 t.result = result
                 t.status = status
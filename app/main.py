@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """Main API application"""
+import contextlib
 import logging
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from opentelemetry import trace
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
@@ -11,6 +13,7 @@ from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExport
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 
 from app.routers.error_handlers import install_error_handlers
+from app.routers.iri_router import IriRouter
 from app.routers.facility import facility
 from app.routers.status import status
 from app.routers.account import account
@@ -19,6 +22,7 @@ from app.routers.filesystem import filesystem
 from app.routers.task import task
 
 from . import config
+from .types.cache import RESPONSE_CACHE
 
 # ------------------------------------------------------------------
 # OpenTelemetry Tracing Configuration
@@ -29,7 +33,7 @@ if config.OPENTELEMETRY_ENABLED:
         "service.version": config.API_VERSION,
         "service.endpoint": config.API_URL_ROOT})
 
-    samplerate = "1.0" if config.OPENTELEMETRY_DEBUG else config.OTEL_SAMPLE_RATE
+    samplerate = 1.0 if config.OPENTELEMETRY_DEBUG else config.OTEL_SAMPLE_RATE
     provider = TracerProvider(resource=resource, sampler=ParentBased(TraceIdRatioBased(samplerate)))
     trace.set_tracer_provider(provider)
 
@@ -43,7 +47,18 @@ if config.OPENTELEMETRY_ENABLED:
     tracer = trace.get_tracer(__name__)
 # ------------------------------------------------------------------
 
-APP = FastAPI(**config.API_CONFIG)
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close the adapters' long-lived clients and the response cache on shutdown."""
+    yield
+    try:
+        await IriRouter.close_adapters()
+    finally:
+        await RESPONSE_CACHE.close()
+
+
+# orjson renders the (already jsonable) response content considerably faster than the stdlib json module
+APP = FastAPI(**config.API_CONFIG, default_response_class=ORJSONResponse, lifespan=lifespan)
 
 if config.OPENTELEMETRY_ENABLED:
     FastAPIInstrumentor.instrument_app(APP)
@@ -60,4 +75,10 @@ APP.include_router(compute.router, prefix=api_prefix)
 APP.include_router(filesystem.router, prefix=api_prefix)
 APP.include_router(task.router, prefix=api_prefix)
 
+# Fail fast if two routers register the same endpoint: the first one would silently shadow the other
+_routes = [(method, route.path) for route in APP.router.routes for method in getattr(route, "methods", None) or ()]
+_duplicate_routes = sorted({r for r in _routes if _routes.count(r) > 1})
+if _duplicate_routes:
+    raise Exception(f"Duplicate routes registered: {_duplicate_routes}")
+
 logging.getLogger().info(f"API path: {api_prefix}")
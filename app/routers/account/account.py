@@ -1,5 +1,6 @@
 from fastapi import Depends, HTTPException, Query, Request
 
+from ...types.cache import cache_response
 from ...types.http import forbidExtraQueryParams
 from ...types.models import Capability
 from ...types.scalars import StrictDateTime
@@ -21,6 +22,7 @@ router = iri_router.IriRouter(
     responses=DEFAULT_RESPONSES,
     operation_id="getCapabilities",
     response_model_exclude_none=True)
+@cache_response(ttl="normal", exclude_none=True)
 async def get_capabilities(
     request : Request,
     name : str = Query(default=None, min_length=1),
@@ -45,13 +47,33 @@ async def get_capability(
     modified_since: StrictDateTime = Query(default=None),
     _forbid = Depends(forbidExtraQueryParams("modified_since")),
     ) -> Capability:
-    caps = await router.adapter.get_capabilities(name=None, modified_since=modified_since, offset=0, limit=100)
-    cc = next((c for c in caps if c.id == capability_id), None)
+    cc = await router.adapter.get_capability(capability_id=capability_id, modified_since=modified_since)
     if not cc:
         raise HTTPException(status_code=404, detail="Capability not found")
     return cc
 
 
+async def _project(
+    project_id : str,
+    user : models.User = Depends(router.current_user_model),
+    ) -> models.Project:
+    project = await router.adapter.get_project(user=user, project_id=project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return project
+
+
+async def _project_allocation(
+    project_allocation_id : str,
+    project : models.Project = Depends(_project),
+    user : models.User = Depends(router.current_user_model),
+    ) -> models.ProjectAllocation:
+    pa = await router.adapter.get_project_allocation(project=project, user=user, project_allocation_id=project_allocation_id)
+    if not pa:
+        raise HTTPException(status_code=404, detail="Project allocation not found")
+    return pa
+
+
 @router.get(
     "/projects",
     dependencies=[Depends(router.current_user)],
@@ -62,11 +84,9 @@ async def get_capability(
 )
 async def get_projects(
     request : Request,
+    user : models.User = Depends(router.current_user_model),
     _forbid = Depends(forbidExtraQueryParams()),
     ) -> list[models.Project]:
-    user = await router.adapter.get_user(user_id=request.state.current_user_id, api_key=request.state.api_key, client_ip=iri_router.get_client_ip(request))
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
     return await router.adapter.get_projects(user)
 
 
@@ -79,18 +99,11 @@ async def get_projects(
     operation_id="getProject",
 )
 async def get_project(
-    project_id : str,
     request : Request,
+    project : models.Project = Depends(_project),
     _forbid = Depends(forbidExtraQueryParams()),
     ) -> models.Project:
-    user = await router.adapter.get_user(user_id=request.state.current_user_id, api_key=request.state.api_key, client_ip=iri_router.get_client_ip(request))
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    projects = await router.adapter.get_projects(user=user)
-    pp = next((p for p in projects if p.id == project_id), None)
-    if not pp:
-        raise HTTPException(status_code=404, detail="Project not found")
-    return pp
+    return project
 
 
 @router.get(
@@ -102,17 +115,11 @@ async def get_project(
     operation_id="getProjectAllocationsByProject",
 )
 async def get_project_allocations(
-    project_id: str,
     request : Request,
+    project : models.Project = Depends(_project),
+    user : models.User = Depends(router.current_user_model),
     _forbid = Depends(forbidExtraQueryParams()),
     ) -> list[models.ProjectAllocation]:
-    user = await router.adapter.get_user(user_id=request.state.current_user_id, api_key=request.state.api_key, client_ip=iri_router.get_client_ip(request))
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    projects = await router.adapter.get_projects(user=user)
-    project = next((p for p in projects if p.id == project_id), None)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
     return await router.adapter.get_project_allocations(project=project, user=user)
 
 
@@ -125,20 +132,10 @@ async def get_project_allocations(
     operation_id="getProjectAllocationByProject",
 )
 async def get_project_allocation(
-    project_id: str,
-    project_allocation_id : str,
     request : Request,
+    pa : models.ProjectAllocation = Depends(_project_allocation),
     _forbid = Depends(forbidExtraQueryParams()),
     ) -> models.ProjectAllocation:
-    user = await router.adapter.get_user(user_id=request.state.current_user_id, api_key=request.state.api_key, client_ip=iri_router.get_client_ip(request))
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    projects = await router.adapter.get_projects(user=user)
-    project = next((p for p in projects if p.id == project_id), None)
-    pas = await router.adapter.get_project_allocations(project=project, user=user)
-    pa = next((pa for pa in pas if pa.id == project_allocation_id), None)
-    if not pa:
-        raise HTTPException(status_code=404, detail="Project allocation not found")
     return pa
 
 
@@ -151,22 +148,11 @@ async def get_project_allocation(
     operation_id="getUserAllocationsByProjectAllocation",
 )
 async def get_user_allocations(
-    project_id: str,
-    project_allocation_id : str,
     request : Request,
+    pa : models.ProjectAllocation = Depends(_project_allocation),
+    user : models.User = Depends(router.current_user_model),
     _forbid = Depends(forbidExtraQueryParams()),
     ) -> list[models.UserAllocation]:
-    user = await router.adapter.get_user(user_id=request.state.current_user_id, api_key=request.state.api_key, client_ip=iri_router.get_client_ip(request))
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    projects = await router.adapter.get_projects(user=user)
-    project = next((p for p in projects if p.id == project_id), None)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    pas = await router.adapter.get_project_allocations(project=project, user=user)
-    pa = next((pa for pa in pas if pa.id == project_allocation_id), None)
-    if not pa:
-        raise HTTPException(status_code=404, detail="Project allocation not found")
     return await router.adapter.get_user_allocations(user=user, project_allocation=pa)
 
 
@@ -179,25 +165,13 @@ async def get_user_allocations(
     operation_id="getUserAllocationByProjectAllocation",
 )
 async def get_user_allocation(
-    project_id: str,
-    project_allocation_id : str,
     user_allocation_id : str,
     request : Request,
+    pa : models.ProjectAllocation = Depends(_project_allocation),
+    user : models.User = Depends(router.current_user_model),
     _forbid = Depends(forbidExtraQueryParams()),
     ) -> models.UserAllocation:
-    user = await router.adapter.get_user(user_id=request.state.current_user_id, api_key=request.state.api_key, client_ip=iri_router.get_client_ip(request))
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    projects = await router.adapter.get_projects(user=user)
-    project = next((p for p in projects if p.id == project_id), None)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    pas = await router.adapter.get_project_allocations(project=project, user=user)
-    pa = next((pa for pa in pas if pa.id == project_allocation_id), None)
-    if not pa:
-        raise HTTPException(status_code=404, detail="Project allocation not found")
-    uas = await router.adapter.get_user_allocations(user=user, project_allocation=pa)
-    ua = next((ua for ua in uas if ua.id == user_allocation_id), None)
+    ua = await router.adapter.get_user_allocation(user=user, project_allocation=pa, user_allocation_id=user_allocation_id)
     if not ua:
         raise HTTPException(status_code=404, detail="User allocation not found")
     return ua
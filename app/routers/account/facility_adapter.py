@@ -1,3 +1,4 @@
+import datetime
 from abc import abstractmethod
 
 from ...types.models import Capability
@@ -16,13 +17,31 @@ class FacilityAdapter(AuthenticatedAdapter):
     async def get_capabilities(
         self : "FacilityAdapter",
         name : str | None = None,
-        modified_since : str | None = None,
+        modified_since : datetime.datetime | None = None,
         offset : int = 0,
         limit : int = 1000
         ) -> list[Capability]:
+        """
+            Return the capabilities matching the given filters, already sliced to `offset`/`limit`.
+            The router returns the result as-is, so filtering and pagination must happen here
+            (ideally in the backend query) rather than by returning every capability.
+        """
         pass
 
 
+    async def get_capability(
+        self : "FacilityAdapter",
+        capability_id : str,
+        modified_since : datetime.datetime | None = None
+        ) -> Capability | None:
+        """
+            Return a single capability, or None if it doesn't exist.
+            The default implementation scans `get_capabilities`; override it when the backend can look up a capability by id.
+        """
+        caps = await self.get_capabilities(modified_since=modified_since)
+        return next((c for c in caps if c.id == capability_id), None)
+
+
     @abstractmethod
     async def get_projects(
         self : "FacilityAdapter",
@@ -31,6 +50,19 @@ class FacilityAdapter(AuthenticatedAdapter):
         pass
 
 
+    async def get_project(
+        self : "FacilityAdapter",
+        user: account_models.User,
+        project_id: str
+        ) -> account_models.Project | None:
+        """
+            Return a single project of the user, or None if it doesn't exist.
+            The default implementation scans `get_projects`; override it when the backend can look up a project by id.
+        """
+        projects = await self.get_projects(user=user)
+        return next((p for p in projects if p.id == project_id), None)
+
+
     @abstractmethod
     async def get_project_allocations(
         self : "FacilityAdapter",
@@ -40,6 +72,20 @@ class FacilityAdapter(AuthenticatedAdapter):
         pass
 
 
+    async def get_project_allocation(
+        self : "FacilityAdapter",
+        project: account_models.Project,
+        user: account_models.User,
+        project_allocation_id: str
+        ) -> account_models.ProjectAllocation | None:
+        """
+            Return a single allocation of the project, or None if it doesn't exist.
+            The default implementation scans `get_project_allocations`; override it when the backend can look up an allocation by id.
+        """
+        pas = await self.get_project_allocations(project=project, user=user)
+        return next((pa for pa in pas if pa.id == project_allocation_id), None)
+
+
     @abstractmethod
     async def get_user_allocations(
         self : "FacilityAdapter",
@@ -47,3 +93,17 @@ class FacilityAdapter(AuthenticatedAdapter):
         project_allocation: account_models.ProjectAllocation
         ) -> list[account_models.UserAllocation]:
         pass
+
+
+    async def get_user_allocation(
+        self : "FacilityAdapter",
+        user: account_models.User,
+        project_allocation: account_models.ProjectAllocation,
+        user_allocation_id: str
+        ) -> account_models.UserAllocation | None:
+        """
+            Return a single user allocation of the project allocation, or None if it doesn't exist.
+            The default implementation scans `get_user_allocations`; override it when the backend can look up an allocation by id.
+        """
+        uas = await self.get_user_allocations(user=user, project_allocation=project_allocation)
+        return next((ua for ua in uas if ua.id == user_allocation_id), None)
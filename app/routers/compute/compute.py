@@ -1,19 +1,50 @@
 """Compute resource API router"""
-from fastapi import Depends, HTTPException, Query, Request, status
+import asyncio
+from typing import Annotated
+
+from fastapi import Body, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
 from ...types.http import forbidExtraQueryParams
 from ...types.scalars import StrictHTTPBool
 from .. import iri_router
+from ..account import models as account_models
 from ..error_handlers import DEFAULT_RESPONSES
+from ..status import models as status_models
 from ..status.status import router as status_router
 from . import facility_adapter, models
 
+# Upper bound on the number of queries in a single /status/batch request
+JOB_STATUS_BATCH_LIMIT = 64
+
+# built once: validates a list of jobs and serializes it directly to json bytes
+_JOB_LIST_ADAPTER = TypeAdapter(list[models.Job])
+# and the same for a single (streamed) job
+_JOB_ADAPTER = TypeAdapter(models.Job)
+
 router = iri_router.IriRouter(
     facility_adapter.FacilityAdapter,
     prefix="/compute",
     tags=["compute"],
 )
 
+async def _user_resource(
+        resource_id: str,
+        request: Request,
+    ) -> tuple[account_models.User, status_models.Resource]:
+    # the user and the resource are independent, so look them up concurrently
+    # (todo: maybe ensure the resource is available)
+    # This could be done via slurm (in the adapter) or via psij's "attach" (https://exaworks.org/psij-python/docs/v/0.9.11/user_guide.html#detaching-and-attaching-jobs)
+    user, resource = await asyncio.gather(
+        router.adapter.get_user(user_id=request.state.current_user_id, api_key=request.state.api_key, client_ip=iri_router.get_client_ip(request)),
+        status_router.adapter.get_resource(resource_id),
+    )
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return (user, resource)
+
+
 @router.post(
     "/job/{resource_id:str}",
     dependencies=[Depends(router.current_user)],
@@ -36,12 +67,7 @@ async def submit_job(
 
     This command will attempt to submit a job and return its id.
     """
-    user = await router.adapter.get_user(user_id=request.state.current_user_id, api_key=request.state.api_key, client_ip=iri_router.get_client_ip(request))
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    # look up the resource (todo: maybe ensure it's available)
-    resource = await status_router.adapter.get_resource(resource_id)
+    user, resource = await _user_resource(resource_id, request)
 
     # the handler can use whatever means it wants to submit the job and then fill in its id
     # see: https://exaworks.org/psij-python/docs/v/0.9.11/user_guide.html#submitting-jobs
@@ -108,12 +134,7 @@ async def update_job(
     - **job_request**: a PSIJ job spec as defined <a href="https://exaworks.org/psij-python/docs/v/0.9.11/.generated/tree.html#jobspec">here</a>
 
     """
-    user = await router.adapter.get_user(user_id=request.state.current_user_id, api_key=request.state.api_key, client_ip=iri_router.get_client_ip(request))
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    # look up the resource (todo: maybe ensure it's available)
-    resource = await status_router.adapter.get_resource(resource_id)
+    user, resource = await _user_resource(resource_id, request)
 
     # the handler can use whatever means it wants to submit the job and then fill in its id
     # see: https://exaworks.org/psij-python/docs/v/0.9.11/user_guide.html#submitting-jobs
@@ -137,19 +158,49 @@ async def get_job_status(
     _forbid = Depends(forbidExtraQueryParams("historical", "include_spec")),
     ):
     """Get a job's status"""
-    user = await router.adapter.get_user(user_id=request.state.current_user_id, api_key=request.state.api_key, client_ip=iri_router.get_client_ip(request))
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    # look up the resource (todo: maybe ensure it's available)
-    # This could be done via slurm (in the adapter) or via psij's "attach" (https://exaworks.org/psij-python/docs/v/0.9.11/user_guide.html#detaching-and-attaching-jobs)
-    resource = await status_router.adapter.get_resource(resource_id)
+    user, resource = await _user_resource(resource_id, request)
 
     job = await router.adapter.get_job(resource=resource, user=user, job_id=job_id, historical=historical, include_spec=include_spec)
 
     return job
 
 
+@router.post(
+    "/status/batch",
+    dependencies=[Depends(router.current_user)],
+    response_model=dict[str, list[models.Job]],
+    response_model_exclude_unset=True,
+    responses=DEFAULT_RESPONSES,
+    operation_id="getJobsBatch",
+)
+async def get_job_statuses_batch(
+    queries : Annotated[list[models.JobStatusQuery], Body(min_length=1, max_length=JOB_STATUS_BATCH_LIMIT)],
+    request : Request,
+    user : account_models.User = Depends(router.current_user_model),
+    _forbid = Depends(forbidExtraQueryParams()),
+    ):
+    """
+    Get multiple jobs' statuses across several resources in a single request
+
+    Each query is answered independently and the results are keyed by its `query_id`.
+    """
+    query_ids = {q.query_id for q in queries}
+    if len(query_ids) != len(queries):
+        raise HTTPException(status_code=400, detail="Duplicate query_id in batch")
+
+    # look up each distinct resource once, then run the queries concurrently
+    resource_ids = list(dict.fromkeys(q.resource_id for q in queries))
+    resources = await asyncio.gather(*[status_router.adapter.get_resource(rid) for rid in resource_ids])
+    resources_by_id = dict(zip(resource_ids, resources))
+
+    results = await asyncio.gather(*[
+        router.adapter.get_jobs(resource=resources_by_id[q.resource_id], user=user, offset=q.offset, limit=q.limit,
+                                filters=q.filters, historical=q.historical, include_spec=q.include_spec)
+        for q in queries
+    ])
+    return {q.query_id: jobs for q, jobs in zip(queries, results)}
+
+
 @router.post(
     "/status/{resource_id:str}",
     dependencies=[Depends(router.current_user)],
@@ -167,19 +218,67 @@ async def get_job_statuses(
     historical : StrictHTTPBool = Query(default=False, description="Whether to include historical jobs. Defaults to false"),
     include_spec: StrictHTTPBool = Query(default=False, description="Whether to include the job specification. Defaults to false"),
     _forbid = Depends(forbidExtraQueryParams("offset", "limit", "filters", "historical", "include_spec")),
-    ):
+    ) -> Response:
     """Get multiple jobs' statuses"""
-    user = await router.adapter.get_user(user_id=request.state.current_user_id, api_key=request.state.api_key, client_ip=iri_router.get_client_ip(request))
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    # look up the resource (todo: maybe ensure it's available)
-    # This could be done via slurm (in the adapter) or via psij's "attach" (https://exaworks.org/psij-python/docs/v/0.9.11/user_guide.html#detaching-and-attaching-jobs)
-    resource = await status_router.adapter.get_resource(resource_id)
+    user, resource = await _user_resource(resource_id, request)
 
     jobs = await router.adapter.get_jobs(resource=resource, user=user, offset=offset, limit=limit, filters=filters, historical=historical, include_spec=include_spec)
 
-    return jobs
+    # validate and render the list straight to json bytes, in one pass each, instead of FastAPI's
+    # per-job response_model round trip (response_model is kept for the openapi schema)
+    jobs = _JOB_LIST_ADAPTER.validate_python(jobs, from_attributes=True)
+    return Response(_JOB_LIST_ADAPTER.dump_json(jobs, exclude_unset=True), media_type="application/json")
+
+
+@router.post(
+    "/status/{resource_id:str}/stream",
+    dependencies=[Depends(router.current_user)],
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "One json encoded job per line",
+            "content": {"application/x-ndjson": {"schema": {"$ref": "#/components/schemas/Job"}}},
+        },
+        **DEFAULT_RESPONSES,
+    },
+    operation_id="streamJobs",
+)
+async def stream_job_statuses(
+    resource_id : str,
+    request : Request,
+    offset : int = Query(default=0, ge=0, le=1000),
+    limit : int = Query(default=100, ge=0, le=1000),
+    filters : dict[str, object] | None = None,
+    historical : StrictHTTPBool = Query(default=False, description="Whether to include historical jobs. Defaults to false"),
+    include_spec: StrictHTTPBool = Query(default=False, description="Whether to include the job specification. Defaults to false"),
+    _forbid = Depends(forbidExtraQueryParams("offset", "limit", "filters", "historical", "include_spec")),
+    ):
+    """
+    Get multiple jobs' statuses as newline-delimited json.
+
+    Jobs are serialized and sent as the adapter produces them, rather than after the whole list is built.
+    """
+    user, resource = await _user_resource(resource_id, request)
+
+    jobs = router.adapter.iter_jobs(resource=resource, user=user, offset=offset, limit=limit, filters=filters, historical=historical, include_spec=include_spec)
+
+    def line(job) -> bytes:
+        # validated like the jobs of get_job_statuses
+        return _JOB_ADAPTER.dump_json(_JOB_ADAPTER.validate_python(job, from_attributes=True), exclude_unset=True) + b"\n"
+
+    # render the first job before the 200 is sent, so an adapter failing (or returning invalid jobs)
+    # from the start still gets a proper error response rather than an empty or truncated stream
+    first = await anext(jobs, None)
+    first_line = b"" if first is None else line(first)
+
+    async def ndjson():
+        if first is None:
+            return
+        yield first_line
+        async for job in jobs:
+            yield line(job)
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
 
 
 @router.delete(
@@ -198,12 +297,7 @@ async def cancel_job(
     _forbid = Depends(forbidExtraQueryParams()),
     ):
     """Cancel a job"""
-    user = await router.adapter.get_user(user_id=request.state.current_user_id, api_key=request.state.api_key, client_ip=iri_router.get_client_ip(request))
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    # look up the resource (todo: maybe ensure it's available)
-    resource = await status_router.adapter.get_resource(resource_id)
+    user, resource = await _user_resource(resource_id, request)
 
     await router.adapter.cancel_job(resource=resource, user=user, job_id=job_id)
 
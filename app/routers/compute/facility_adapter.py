@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from collections.abc import AsyncIterator
 from ..status import models as status_models
 from ..account import models as account_models
 from . import models as compute_models
@@ -71,6 +72,26 @@ class FacilityAdapter(AuthenticatedAdapter):
         pass
 
 
+    async def iter_jobs(
+        self: "FacilityAdapter",
+        resource: status_models.Resource,
+        user: account_models.User,
+        offset : int,
+        limit : int,
+        filters: dict[str, object] | None = None,
+        historical: bool = False,
+        include_spec: bool = False
+    ) -> AsyncIterator[compute_models.Job]:
+        """
+            Yield the jobs matching the given criteria, one at a time.
+            The default implementation yields from `get_jobs`; override it when the backend can
+            page through (or stream) its jobs, so the streaming endpoint never holds the whole list.
+        """
+        for job in await self.get_jobs(resource=resource, user=user, offset=offset, limit=limit, filters=filters,
+                                       historical=historical, include_spec=include_spec):
+            yield job
+
+
     @abstractmethod
     async def cancel_job(
         self: "FacilityAdapter",
@@ -129,3 +129,17 @@ class Job(IRIBaseModel):
     id : str
     status : JobStatus | None = None
     job_spec : JobSpec | None = None
+
+
+class JobStatusQuery(IRIBaseModel):
+    """
+    A single query of a batched job status request.
+    """
+    model_config = ConfigDict(extra="forbid")
+    query_id: Annotated[str, Field(min_length=1, description="Identifier chosen by the client to key this query's results")]
+    resource_id: Annotated[str, Field(min_length=1, description="The compute resource to query")]
+    offset: Annotated[int, Field(ge=0, le=1000)] = 0
+    limit: Annotated[int, Field(ge=0, le=1000)] = 100
+    filters: dict[str, object] | None = None
+    historical: Annotated[StrictBool, Field(description="Whether to include historical jobs")] = False
+    include_spec: Annotated[StrictBool, Field(description="Whether to include the job specification")] = False
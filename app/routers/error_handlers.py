@@ -5,10 +5,20 @@ Default problem schema and example responses for various HTTP status codes.
 import logging
 from urllib.parse import urlsplit, urlunsplit, quote
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+
+class NotFound(HTTPException):
+    """
+    Raised (typically by a facility adapter) when the requested object doesn't exist.
+    It is answered with the same 404 problem response as any other HTTPException(404).
+    """
+    def __init__(self, detail: str = "Item not found", headers: dict[str, str] | None = None):
+        super().__init__(status_code=404, detail=detail, headers=headers)
+
+
 def get_url_base(request: Request) -> str:
     """Return the base URL for the API."""
     # If behind a proxy (and x-forwarded-* headers present), use the forwarded host and protocol
@@ -72,6 +82,19 @@ def install_error_handlers(app: FastAPI):
     # 400 — VALIDATION ERRORS
     @app.exception_handler(RequestValidationError)
     async def validation_error_handler(request: Request, exc: RequestValidationError):
+        # an unknown key rejected by an extra="forbid" query parameter model
+        # is answered like forbidExtraQueryParams answers it in the other routers
+        for err in exc.errors():
+            loc = err.get("loc") or ()
+            if err.get("type") == "extra_forbidden" and len(loc) == 2 and loc[0] == "query":
+                return problem_response(
+                    request=request,
+                    status=422,
+                    title="Error",
+                    detail=f"Unexpected query parameter: {loc[1]}",
+                    problem_type="generic-error",
+                )
+
         invalid_params = []
 
         for err in exc.errors():
@@ -95,9 +118,9 @@ def install_error_handlers(app: FastAPI):
     async def http_exception_handler(request: Request, exc: HTTPException):
 
         if exc.status_code == 304:
-            return JSONResponse(
+            # a 304 must not have a body
+            return Response(
                 status_code=304,
-                content=None,
                 headers=exc.headers or {})
 
         if exc.status_code == 401:
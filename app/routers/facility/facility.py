@@ -1,43 +1,48 @@
-from fastapi import Depends, Query, Request
+from typing import Annotated
 
-from ...types.http import forbidExtraQueryParams
-from ...types.scalars import StrictDateTime
+from fastapi import Depends, Query, Request, Response
+
+from ...types.cache import cache_response
+from ...types.http import forbidRepeatedQueryParams
 from .. import iri_router
 from ..error_handlers import DEFAULT_RESPONSES
 from . import facility_adapter, models
+from .params import ListSitesParams, ModifiedSinceParams
 
 router = iri_router.IriRouter(facility_adapter.FacilityAdapter,
                               prefix="/facility",
-                              tags=["facility"])
+                              tags=["facility"],
+                              dependencies=[Depends(forbidRepeatedQueryParams)])
 
 @router.get("", responses=DEFAULT_RESPONSES, operation_id="getFacility")
+@cache_response(ttl="long")
 async def get_facility(
     request: Request,
-    modified_since: StrictDateTime = Query(default=None),
-    _forbid = Depends(forbidExtraQueryParams("modified_since")),
+    params: Annotated[ModifiedSinceParams, Query()],
     ) -> models.Facility:
     """Get facility information"""
-    return await router.adapter.get_facility(modified_since=modified_since)
+    return await router.adapter.get_facility(modified_since=params.modified_since)
 
 @router.get("/sites", responses=DEFAULT_RESPONSES, operation_id="getSites")
+@cache_response(ttl="normal")
 async def list_sites(
     request: Request,
-    modified_since: StrictDateTime = Query(default=None),
-    name: str = Query(default=None, min_length=1),
-    offset: int = Query(default=0, ge=0, le=1000),
-    limit: int = Query(default=100, ge=0, le=1000),
-    short_name: str = Query(default=None, min_length=1),
-    _forbid = Depends(forbidExtraQueryParams("modified_since", "name", "offset", "limit", "short_name")),
+    params: Annotated[ListSitesParams, Query()],
     )-> list[models.Site]:
     """List sites"""
-    return await router.adapter.list_sites(modified_since=modified_since, name=name, offset=offset, limit=limit, short_name=short_name)
+    filters = dict(modified_since=params.modified_since, name=params.name, offset=params.offset,
+                   limit=params.limit, short_name=params.short_name)
+    raw = await router.adapter.list_sites_raw(**filters)
+    if raw is not None:
+        return Response(content=raw, media_type="application/json")
+    return await router.adapter.list_sites(**filters)
 
 @router.get("/sites/{site_id}", responses=DEFAULT_RESPONSES, operation_id="getSite")
+@cache_response(ttl="normal")
 async def get_site(
     request: Request,
     site_id: str,
-    modified_since: StrictDateTime = Query(default=None),
-    _forbid = Depends(forbidExtraQueryParams("modified_since")),
+    params: Annotated[ModifiedSinceParams, Query()],
     )-> models.Site:
     """Get site by ID"""
-    return await router.adapter.get_site(site_id=site_id, modified_since=modified_since)
+    return await router.adapter.get_site(site_id=site_id, modified_since=params.modified_since)
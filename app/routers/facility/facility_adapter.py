@@ -1,3 +1,4 @@
+import datetime
 from abc import abstractmethod
 from . import models as facility_models
 from ..iri_router import AuthenticatedAdapter
@@ -13,25 +14,47 @@ class FacilityAdapter(AuthenticatedAdapter):
     @abstractmethod
     async def get_facility(
         self: "FacilityAdapter",
-        modified_since: str | None = None
+        modified_since: datetime.datetime | None = None
         ) -> facility_models.Facility | None:
         pass
 
     @abstractmethod
     async def list_sites(
         self: "FacilityAdapter",
-        modified_since: str | None = None,
+        modified_since: datetime.datetime | None = None,
         name: str | None = None,
         offset: int | None = None,
         limit: int | None = None,
         short_name: str | None = None
         ) -> list[facility_models.Site]:
+        """
+            Return the sites matching the given filters, already sliced to `offset`/`limit`
+            (so never more than `limit` sites). The router returns the result as-is, so filtering
+            and pagination must happen here, pushed down into the backend query where there is one,
+            rather than by fetching every site and slicing afterwards.
+        """
         pass
 
+    async def list_sites_raw(
+        self: "FacilityAdapter",
+        modified_since: datetime.datetime | None = None,
+        name: str | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        short_name: str | None = None
+        ) -> bytes | None:
+        """
+            Optionally return the site list as an already serialized json array (the same body `list_sites`
+            would produce), eg. when the backend keeps it pre-rendered. The router sends these bytes as-is,
+            without validating them. The default returns None, which makes the router call `list_sites`.
+        """
+        return None
+
+
     @abstractmethod
     async def get_site(
         self: "FacilityAdapter",
         site_id: str,
-        modified_since: str | None = None,
+        modified_since: datetime.datetime | None = None,
     ) -> facility_models.Site | None:
         pass
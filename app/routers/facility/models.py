@@ -1,12 +1,35 @@
 """Facility-related models."""
 from typing import List, Optional
 
-from pydantic import Field, HttpUrl
+from pydantic import ConfigDict, Field, HttpUrl, computed_field, model_validator
 
-from ...types.base import NamedObject
+from ... import config
+from ...types.base import IndexedCollection, NamedObject
+from ...types.scalars import Uri
+
+
+def _ids_from_uris(data, uris_field: str, ids_field: str, path: str):
+    """
+        Turn the legacy `*_uris` constructor argument (links like `{API_BASE_URL}{path}/{id}`) into the `*_ids`
+        the links are now computed from, rather than letting it disappear into the extra fields.
+    """
+    if not isinstance(data, dict) or uris_field not in data:
+        return data
+    data = dict(data)
+    ids = []
+    for uri in data.pop(uris_field) or []:
+        _, sep, id_ = str(uri).rstrip("/").rpartition(f"{path}/")
+        if not sep or not id_ or "/" in id_:
+            raise ValueError(f"{uris_field}: {uri} is not a {path} link")
+        ids.append(id_)
+    data.setdefault(ids_field, ids)
+    return data
 
 
 class Site(NamedObject):
+    # sites and facilities are reference data: adapters build them once and the api only reads them
+    model_config = ConfigDict(frozen=True)
+
     def _self_path(self) -> str:
         return f"/facility/sites/{self.id}"
     short_name: Optional[str] = Field(None, description="Common or short name of the Site.")
@@ -19,23 +42,54 @@ class Site(NamedObject):
     altitude: Optional[float] = Field(None, description="Altitude of the Location.")
     latitude: Optional[float] = Field(None, description="Latitude of the Location.")
     longitude: Optional[float] = Field(None, description="Longitude of the Location.")
-    resource_uris: List[HttpUrl] = Field(default_factory=list, description="URIs of Resources hosted at this Site.")
+    resource_ids: List[str] = Field(default_factory=list, exclude=True)
 
+    @model_validator(mode="before")
     @classmethod
-    def find(cls, items, name=None, description=None, modified_since=None, short_name=None, country_name=None):
-        """ Find Locations matching the given criteria. """
-        items = super().find(items, name=name, description=description, modified_since=modified_since)
+    def _legacy_resource_uris(cls, data):
+        return _ids_from_uris(data, "resource_uris", "resource_ids", "/status/resources")
+
+    @computed_field(description="URIs of Resources hosted at this Site.")
+    @property
+    def resource_uris(self) -> List[Uri]:
+        """ Return the list of resource URIs for this site. """
+        return [f"{config.API_BASE_URL}/status/resources/{r}" for r in self.resource_ids]
+
+    @classmethod
+    def _predicates(cls, name=None, description=None, modified_since=None, short_name=None, country_name=None):
+        preds = super()._predicates(name=name, description=description, modified_since=modified_since)
         if short_name:
-            items = [item for item in items if item.short_name == short_name]
+            preds.append(lambda item: item.short_name == short_name)
         if country_name:
-            items = [item for item in items if item.country_name == country_name]
-        return items
+            preds.append(lambda item: item.country_name == country_name)
+        return preds
+
+    @classmethod
+    def find(cls, items, name=None, description=None, modified_since=None, short_name=None, country_name=None):
+        """ Find Locations matching the given criteria. """
+        if isinstance(items, IndexedCollection):
+            items = items.select(name=name, modified_since=cls.normalize_dt(modified_since), short_name=short_name, country_name=country_name)
+        return cls._filter(items, cls._predicates(name=name, description=description, modified_since=modified_since,
+                                                  short_name=short_name, country_name=country_name))
 
 
 class Facility(NamedObject):
+    model_config = ConfigDict(frozen=True)
+
     def _self_path(self) -> str:
         return "/facility"
     short_name: Optional[str] = Field(None, description="Common or short name of the Facility.")
     organization_name: Optional[str] = Field(None, description="Operating organization’s name.")
     support_uri: Optional[HttpUrl] = Field(None, description="Link to facility support portal.")
-    site_uris: List[HttpUrl] = Field(default_factory=list, description="URIs of associated Sites.")
+    site_ids: List[str] = Field(default_factory=list, exclude=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _legacy_site_uris(cls, data):
+        return _ids_from_uris(data, "site_uris", "site_ids", "/facility/sites")
+
+    @computed_field(description="URIs of associated Sites.")
+    @property
+    def site_uris(self) -> List[Uri]:
+        """ Return the list of site URIs for this facility. """
+        return [f"{config.API_BASE_URL}/facility/sites/{s}" for s in self.site_ids]
@@ -0,0 +1,21 @@
+"""Query parameter models of the facility endpoints"""
+from pydantic import BaseModel, ConfigDict, Field
+
+from ...types.scalars import StrictDateTime
+
+
+class ModifiedSinceParams(BaseModel):
+    """Query parameters of the single-object facility endpoints."""
+    # unknown query parameters are rejected in the same validation pass as the known ones;
+    # repeated ones by the router's forbidRepeatedQueryParams
+    model_config = ConfigDict(extra="forbid")
+
+    modified_since: StrictDateTime | None = None
+
+
+class ListSitesParams(ModifiedSinceParams):
+    """Query parameters of the site list."""
+    name: str | None = Field(default=None, min_length=1)
+    offset: int = Field(default=0, ge=0, le=1000)
+    limit: int = Field(default=100, ge=0, le=1000)
+    short_name: str | None = Field(default=None, min_length=1)
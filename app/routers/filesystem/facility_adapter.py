@@ -79,7 +79,7 @@ class FacilityAdapter(AuthenticatedAdapter):
         path: str,
         file_bytes: int | None,
         lines: int | None,
-        skip_trailing: bool
+        skip_heading: bool
         ) -> Tuple[Any, int]:
         pass
 
@@ -4,6 +4,7 @@
 #
 # Please, refer to the LICENSE file in the root directory.
 # SPDX-License-Identifier: BSD-3-Clause
+import asyncio
 import base64
 from typing import Annotated
 from fastapi import (
@@ -34,12 +35,14 @@ async def _user_resource(
         resource_id: str,
         request: Request,
     ) -> tuple[account_models.User, status_models.Resource]:
-    user = await router.adapter.get_user(user_id=request.state.current_user_id, api_key=request.state.api_key, client_ip=iri_router.get_client_ip(request))
+    # the user and the resource are independent, so look them up concurrently
+    # (todo: maybe ensure the resource is available)
+    user, resource = await asyncio.gather(
+        router.adapter.get_user(user_id=request.state.current_user_id, api_key=request.state.api_key, client_ip=iri_router.get_client_ip(request)),
+        status_router.adapter.get_resource(resource_id),
+    )
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-
-    # look up the resource (todo: maybe ensure it's available)
-    resource = await status_router.adapter.get_resource(resource_id=resource_id)
     if not resource:
         raise HTTPException(status_code=404, detail="Resource not found")
     return (user, resource)
@@ -64,9 +67,7 @@ async def put_chmod(
     return await router.task_adapter.put_task(
         user=user,
         resource=resource,
-        task=task_models.TaskCommand(
-            router=router.get_router_name(),
-            command="chmod",
+        task=task_models.ChmodCommand(
             args={
                 "request_model": request_model,
             }
@@ -93,9 +94,7 @@ async def put_chown(
     return await router.task_adapter.put_task(
         user=user,
         resource=resource,
-        task=task_models.TaskCommand(
-            router=router.get_router_name(),
-            command="chown",
+        task=task_models.ChownCommand(
             args={
                 "request_model": request_model,
             }
@@ -123,9 +122,7 @@ async def get_file(
     return await router.task_adapter.put_task(
         user=user,
         resource=resource,
-        task=task_models.TaskCommand(
-            router=router.get_router_name(),
-            command="file",
+        task=task_models.FileCommand(
             args={
                 "path": path,
             }
@@ -153,9 +150,7 @@ async def get_stat(
     return await router.task_adapter.put_task(
         user=user,
         resource=resource,
-        task=task_models.TaskCommand(
-            router=router.get_router_name(),
-            command="stat",
+        task=task_models.StatCommand(
             args={
                 "path": path,
                 "dereference": dereference,
@@ -183,9 +178,7 @@ async def post_mkdir(
     return await router.task_adapter.put_task(
         user=user,
         resource=resource,
-        task=task_models.TaskCommand(
-            router=router.get_router_name(),
-            command="mkdir",
+        task=task_models.MkdirCommand(
             args={
                 "request_model": request_model,
             }
@@ -213,9 +206,7 @@ async def post_symlink(
     return await router.task_adapter.put_task(
         user=user,
         resource=resource,
-        task=task_models.TaskCommand(
-            router=router.get_router_name(),
-            command="symlink",
+        task=task_models.SymlinkCommand(
             args={
                 "request_model": request_model,
             }
@@ -259,9 +250,7 @@ async def get_ls_async(
     return await router.task_adapter.put_task(
         user=user,
         resource=resource,
-        task=task_models.TaskCommand(
-            router=router.get_router_name(),
-            command="ls",
+        task=task_models.LsCommand(
             args={
                 "path": path,
                 "show_hidden": show_hidden,
@@ -327,9 +316,7 @@ async def get_head(
     return await router.task_adapter.put_task(
         user=user,
         resource=resource,
-        task=task_models.TaskCommand(
-            router=router.get_router_name(),
-            command="head",
+        task=task_models.HeadCommand(
             args={
                 "path": path,
                 "file_bytes": file_bytes,
@@ -365,9 +352,7 @@ async def get_view(
     return await router.task_adapter.put_task(
         user=user,
         resource=resource,
-        task=task_models.TaskCommand(
-            router=router.get_router_name(),
-            command="view",
+        task=task_models.ViewCommand(
             args={
                 "path": path,
                 "size": size,
@@ -424,9 +409,7 @@ async def get_tail(
     return await router.task_adapter.put_task(
         user=user,
         resource=resource,
-        task=task_models.TaskCommand(
-            router=router.get_router_name(),
-            command="tail",
+        task=task_models.TailCommand(
             args={
                 "path": path,
                 "file_bytes": file_bytes,
@@ -457,9 +440,7 @@ async def get_checksum(
     return await router.task_adapter.put_task(
         user=user,
         resource=resource,
-        task=task_models.TaskCommand(
-            router=router.get_router_name(),
-            command="checksum",
+        task=task_models.ChecksumCommand(
             args={
                 "path": path,
             }
@@ -483,9 +464,7 @@ async def delete_rm(
     return await router.task_adapter.put_task(
         user=user,
         resource=resource,
-        task=task_models.TaskCommand(
-            router=router.get_router_name(),
-            command="rm",
+        task=task_models.RmCommand(
             args={
                 "path": path,
             }
@@ -512,9 +491,7 @@ async def post_compress(
     return await router.task_adapter.put_task(
         user=user,
         resource=resource,
-        task=task_models.TaskCommand(
-            router=router.get_router_name(),
-            command="compress",
+        task=task_models.CompressCommand(
             args={
                 "request_model": request_model,
             }
@@ -541,9 +518,7 @@ async def post_extract(
     return await router.task_adapter.put_task(
         user=user,
         resource=resource,
-        task=task_models.TaskCommand(
-            router=router.get_router_name(),
-            command="extract",
+        task=task_models.ExtractCommand(
             args={
                 "request_model": request_model,
             }
@@ -570,9 +545,7 @@ async def move_mv(
     return await router.task_adapter.put_task(
         user=user,
         resource=resource,
-        task=task_models.TaskCommand(
-            router=router.get_router_name(),
-            command="mv",
+        task=task_models.MoveCommand(
             args={
                 "request_model": request_model,
             }
@@ -599,9 +572,7 @@ async def post_cp(
     return await router.task_adapter.put_task(
         user=user,
         resource=resource,
-        task=task_models.TaskCommand(
-            router=router.get_router_name(),
-            command="cp",
+        task=task_models.CopyCommand(
             args={
                 "request_model": request_model,
             }
@@ -627,9 +598,7 @@ async def get_download(
     return await router.task_adapter.put_task(
         user=user,
         resource=resource,
-        task=task_models.TaskCommand(
-            router=router.get_router_name(),
-            command="download",
+        task=task_models.DownloadCommand(
             args={
                 "path": path,
             }
@@ -656,7 +625,8 @@ async def post_upload(
     file: UploadFile = File(description="File to be uploaded as `multipart/form-data`"),
 ) -> str:
     user, resource = await _user_resource(resource_id, request)
-    raw_content = file.file.read()
+    # read one byte past the limit: enough to reject an oversized file without loading all of it
+    raw_content = file.file.read(facility_adapter.OPS_SIZE_LIMIT + 1)
 
     if len(raw_content) > facility_adapter.OPS_SIZE_LIMIT:
         raise HTTPException(
@@ -667,9 +637,7 @@ async def post_upload(
     return await router.task_adapter.put_task(
         user=user,
         resource=resource,
-        task=task_models.TaskCommand(
-            router=router.get_router_name(),
-            command="upload",
+        task=task_models.UploadCommand(
             args={
                 "path": path,
                 "content": base64.b64encode(raw_content).decode('utf-8'),
@@ -1,31 +1,52 @@
 from abc import ABC, abstractmethod
+import asyncio
 import traceback
 import os
 import logging
 import importlib
+import functools
 from fastapi import Request, Depends, HTTPException, APIRouter
+from fastapi.responses import ORJSONResponse
 from fastapi.security import APIKeyHeader
 from .account.models import User
 
 
 bearer_token = APIKeyHeader(name="Authorization")
 
+# show the routers without an IRI_API_ADAPTER_* variable (backed by the demo adapter) instead of hiding them
+_SHOW_MISSING = os.environ.get("IRI_SHOW_MISSING_ROUTES") in {"true", "1", "on", "yes"}
+
 
 def get_client_ip(request : Request) -> str|None:
-    forwarded_for = request.headers.get("X-Forwarded-For")
+    """Return the client's ip address. The result is memoized on `request.state`, so repeated calls within a request are free."""
+    state = request.state
+    if hasattr(state, "client_ip"):
+        return state.client_ip
+    headers = request.headers
+    forwarded_for = headers.get("x-forwarded-for")
     if forwarded_for:
-        return forwarded_for.split(",")[0].strip()
+        # the first address is the client, the rest are the proxies it went through
+        ip_addr = forwarded_for.partition(",")[0].strip()
     else:
-        ip_addr = request.headers.get('HTTP_X_REAL_IP')
-        if not ip_addr:
-            ip_addr = request.headers.get('x-real-ip')
-            if not ip_addr:
-                ip_addr = request.client.host
-        return ip_addr
+        ip_addr = headers.get("x-real-ip") or request.client.host
+    state.client_ip = ip_addr
+    return ip_addr
+
+
+@functools.cache
+def _load_adapter_class(adapter_name: str) -> type:
+    """Import and return the class named by the fully qualified `adapter_name`. Each name is only imported once."""
+    module_name, class_name = adapter_name.rsplit(".", 1)
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 class IriRouter(APIRouter):
+    # adapter instances by their fully qualified class name, shared by every router configured with the same adapter
+    _adapters: dict[str, "Adapter"] = {}
+
     def __init__(self, router_adapter=None, task_router_adapter=None, **kwargs):
+        # serialize with orjson even if the router is included in an app that doesn't default to it
+        kwargs.setdefault("default_response_class", ORJSONResponse)
         super().__init__(**kwargs)
         router_name = self.get_router_name()
         self.adapter = IriRouter.create_adapter(router_name, router_adapter)
@@ -47,17 +68,18 @@ class IriRouter(APIRouter):
 
 
     @staticmethod
+    @functools.cache
     def _get_adapter_name(router_name: str) -> str|None:
-        """Return the adapter name, or None if it's not configured and IRI_SHOW_MISSING_ROUTES is true"""
+        """Return the adapter name, or None if it's not configured and IRI_SHOW_MISSING_ROUTES is not true"""
         # if there is no adapter specified for this router,
         # and IRI_SHOW_MISSING_ROUTES is not true,
         # hide the router
-        env_var = f"IRI_API_ADAPTER_{router_name}"
-        if env_var not in os.environ and os.environ.get("IRI_SHOW_MISSING_ROUTES") not in ["true", "1", "on", "yes"]:
+        adapter_name = os.environ.get(f"IRI_API_ADAPTER_{router_name}")
+        if adapter_name is None and not _SHOW_MISSING:
             return None
 
         # find and load the actual implementation
-        return os.environ.get(env_var, "app.demo_adapter.DemoAdapter")
+        return "app.demo_adapter.DemoAdapter" if adapter_name is None else adapter_name
 
 
     @staticmethod
@@ -67,15 +89,24 @@ class IriRouter(APIRouter):
         if not adapter_name:
             return None
 
-
-        parts = adapter_name.rsplit(".", 1)
-        module = importlib.import_module(parts[0])
-        AdapterClass = getattr(module, parts[1])
+        AdapterClass = _load_adapter_class(adapter_name)
         if not issubclass(AdapterClass, router_adapter):
             raise Exception(f"{adapter_name} should implement FacilityAdapter")
 
-        # assign it
-        return AdapterClass()
+        # assign it, reusing the instance (and its state) if another router already created one
+        if adapter_name not in IriRouter._adapters:
+            IriRouter._adapters[adapter_name] = AdapterClass()
+        return IriRouter._adapters[adapter_name]
+
+
+    @staticmethod
+    async def close_adapters():
+        """Close every adapter instance, eg. on shutdown. A failing adapter is logged, and doesn't keep the others open."""
+        adapters = list(IriRouter._adapters.items())
+        results = await asyncio.gather(*(adapter.close() for _, adapter in adapters), return_exceptions=True)
+        for (adapter_name, _), result in zip(adapters, results):
+            if isinstance(result, BaseException):
+                logging.getLogger().error(f"Closing the {adapter_name} adapter failed: {result!r}")
 
 
     async def current_user(
@@ -96,7 +127,40 @@ class IriRouter(APIRouter):
         request.state.api_key = api_key
 
 
-class AuthenticatedAdapter(ABC):
+    async def current_user_model(
+        self,
+        request : Request,
+        api_key: str = Depends(bearer_token),
+    ) -> User:
+        """
+            Return the authenticated user's details.
+            FastAPI caches dependency results within a request, so every endpoint and
+            sub-dependency that depends on this shares a single `get_user` adapter call.
+        """
+        if not hasattr(request.state, "current_user_id"):
+            await self.current_user(request, api_key)
+        user = await self.adapter.get_user(user_id=request.state.current_user_id, api_key=request.state.api_key, client_ip=get_client_ip(request))
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        return user
+
+
+class Adapter(ABC):
+    """The base of every facility adapter interface."""
+
+    async def close(
+        self : "Adapter",
+        ) -> None:
+        """
+            Release the long-lived clients (http sessions, ssh connections, connection pools) held by the adapter.
+            Adapter instances are shared and live as long as the api, so create such clients once (eg. on first use)
+            and reuse their keep-alive connections for every call, including each `on_task` command, rather than
+            connecting per call. Called once, when the api shuts down.
+        """
+        pass
+
+
+class AuthenticatedAdapter(Adapter):
 
     @abstractmethod
     async def get_current_user(
@@ -123,3 +187,4 @@ class AuthenticatedAdapter(ABC):
             Retrieve additional user information (name, email, etc.) for the given user_id.
         """
         pass
+
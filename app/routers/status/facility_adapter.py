@@ -1,17 +1,21 @@
 import datetime
-from abc import ABC, abstractmethod
-
-from fastapi import Query
+from abc import abstractmethod
 
 from ...types.models import Capability
+from ..iri_router import Adapter
 from . import models as status_models
 
 
-class FacilityAdapter(ABC):
+class FacilityAdapter(Adapter):
     """
     Facility-specific code is handled by the implementation of this interface.
     Use the `IRI_API_ADAPTER` environment variable (defaults to `app.demo_adapter.FacilityAdapter`) 
     to install your facility adapter before the API starts.
+
+    The list methods (`get_resources`, `get_events`, `get_incidents`) receive every filter of the request,
+    and their result is returned as-is. Apply the filters and `offset`/`limit` in the backend query
+    (eg. as indexed WHERE clauses, with the limit pushed down too), rather than fetching every row and
+    filtering it in python. A `None` filter means "don't filter on this".
     """
 
 
@@ -24,11 +28,15 @@ class FacilityAdapter(ABC):
         description : str | None = None,
         group : str | None = None,
         modified_since : datetime.datetime | None = None,
-        resource_type: status_models.ResourceType = Query(default=None),
-        current_status: status_models.Status = Query(default=None),
+        resource_type: status_models.ResourceType | None = None,
+        current_status: status_models.Status | None = None,
         capability: Capability | None = None,
         site_id: str | None = None
         ) -> list[status_models.Resource]:
+        """
+            Return at most `limit` resources, skipping the first `offset`, matching all the given filters:
+            `name` and `group` exactly, `description` as a substring, `last_modified` at or after `modified_since`.
+        """
         pass
 
 
@@ -37,6 +45,9 @@ class FacilityAdapter(ABC):
         self : "FacilityAdapter",
         id_ : str
         ) -> status_models.Resource:
+        """
+            Return the resource with the given id, or raise `NotFound` (from `app.routers.error_handlers`) if there is none.
+        """
         pass
 
 
@@ -55,6 +66,10 @@ class FacilityAdapter(ABC):
         time_ : datetime.datetime | None = None,
         modified_since : datetime.datetime | None = None
         ) -> list[status_models.Event]:
+        """
+            Return at most `limit` events of the incident, skipping the first `offset`, matching all the given filters.
+            `from_`/`to` bound `occurred_at` (inclusive/exclusive), `time_` matches it exactly.
+        """
         pass
 
 
@@ -64,6 +79,9 @@ class FacilityAdapter(ABC):
         incident_id : str,
         id_ : str
         ) -> status_models.Event:
+        """
+            Return the event with the given id, or raise `NotFound` (from `app.routers.error_handlers`) if there is none.
+        """
         pass
 
 
@@ -83,6 +101,10 @@ class FacilityAdapter(ABC):
         resource_id : str | None = None,
         resolution: status_models.Resolution | None = None
         ) -> list[status_models.Incident]:
+        """
+            Return at most `limit` incidents, skipping the first `offset`, matching all the given filters.
+            `resource_id` matches incidents that may impact that resource, `time_` those ongoing at that time.
+        """
         pass
 
 
@@ -91,4 +113,7 @@ class FacilityAdapter(ABC):
         self : "FacilityAdapter",
         id_ : str
         ) -> status_models.Incident:
+        """
+            Return the incident with the given id, or raise `NotFound` (from `app.routers.error_handlers`) if there is none.
+        """
         pass
@@ -5,7 +5,7 @@ from typing import Optional
 from pydantic import BaseModel, Field, HttpUrl, computed_field, field_validator
 
 from ... import config
-from ...types.base import NamedObject
+from ...types.base import IndexedCollection, NamedObject
 
 
 class Link(BaseModel):
@@ -13,14 +13,14 @@ class Link(BaseModel):
     href : str
 
 
-class Status(enum.Enum):
+class Status(str, enum.Enum):
     up = "up"
     down = "down"
     degraded = "degraded"
     unknown = "unknown"
 
 
-class ResourceType(enum.Enum):
+class ResourceType(str, enum.Enum):
     website = "website"
     service = "service"
     compute = "compute"
@@ -51,26 +51,35 @@ class Resource(NamedObject):
     @property
     def capability_uris(self) -> list[str]:
         """ Return the list of capability URIs for this resource. """
-        return [f"{config.API_URL_ROOT}{config.API_PREFIX}{config.API_URL}/account/capabilities/{e}" for e in self.capability_ids]
+        return [f"{config.API_BASE_URL}/account/capabilities/{e}" for e in self.capability_ids]
 
     @classmethod
-    def find(cls, items, name=None, description=None, modified_since=None, group=None,
-             resource_type=None, current_status=None, capability=None, site_id=None) -> list:
-        items = super().find(items, name=name, description=description, modified_since=modified_since)
+    def _predicates(cls, name=None, description=None, modified_since=None, group=None,
+                    resource_type=None, current_status=None, capability=None, site_id=None):
+        preds = super()._predicates(name=name, description=description, modified_since=modified_since)
         if group:
-            items = [item for item in items if item.group == group]
+            preds.append(lambda item: item.group == group)
         if resource_type:
-            if isinstance(resource_type, str):
-                resource_type = ResourceType(resource_type)
-            items = [item for item in items if item.resource_type == resource_type]
+            preds.append(lambda item: item.resource_type == resource_type)
         if current_status:
-            items = [item for item in items if item.current_status == current_status]
+            preds.append(lambda item: item.current_status == current_status)
         if capability:
-            items = [item for item in items
-                     if any(cap_id in item.capability_ids for cap_id in capability)]
+            preds.append(lambda item: any(cap_id in item.capability_ids for cap_id in capability))
         if site_id:
-            items = [item for item in items if item.site_id == site_id]
-        return items
+            preds.append(lambda item: item.site_id == site_id)
+        return preds
+
+    @classmethod
+    def find(cls, items, name=None, description=None, modified_since=None, group=None,
+             resource_type=None, current_status=None, capability=None, site_id=None) -> list:
+        if isinstance(resource_type, str):
+            resource_type = ResourceType(resource_type)
+        if isinstance(items, IndexedCollection):
+            items = items.select(name=name, modified_since=cls.normalize_dt(modified_since), group=group,
+                                 resource_type=resource_type, current_status=current_status, site_id=site_id)
+        return cls._filter(items, cls._predicates(name=name, description=description, modified_since=modified_since, group=group,
+                                                  resource_type=resource_type, current_status=current_status, capability=capability,
+                                                  site_id=site_id))
 
 class Event(NamedObject):
 
@@ -92,47 +101,54 @@ class Event(NamedObject):
     @property
     def resource_uri(self) -> str:
         """ Return the resource URI for this event. """
-        return f"{config.API_URL_ROOT}{config.API_PREFIX}{config.API_URL}/status/resources/{self.resource_id}"
+        return f"{config.API_BASE_URL}/status/resources/{self.resource_id}"
 
     @computed_field(description="The event's incident")
     @property
     def incident_uri(self) -> str|None:
         """ Return the incident URI for this event. """
-        return f"{config.API_URL_ROOT}{config.API_PREFIX}{config.API_URL}/status/incidents/{self.incident_id}" if self.incident_id else None
+        return f"{config.API_BASE_URL}/status/incidents/{self.incident_id}" if self.incident_id else None
 
 
     @classmethod
-    def find(cls, items, name=None, description=None, modified_since=None,
-             resource_id=None, status=None, from_=None, to=None, time_=None) -> list:
-        items = super().find(items, name=name, description=description, modified_since=modified_since)
-
+    def _predicates(cls, name=None, description=None, modified_since=None,
+                    resource_id=None, status=None, from_=None, to=None, time_=None):
+        preds = super()._predicates(name=name, description=description, modified_since=modified_since)
         if resource_id:
-            items = [e for e in items if e.resource_id == resource_id]
+            preds.append(lambda e: e.resource_id == resource_id)
         if status:
-            if isinstance(status, str):
-                status = Status(status)
-            items = [e for e in items if e.status == status]
+            preds.append(lambda e: e.status == status)
 
         from_ = cls.normalize_dt(from_) if from_ else None
         to = cls.normalize_dt(to) if to else None
         time_ = cls.normalize_dt(time_) if time_ else None
 
         if from_:
-            items = [e for e in items if e.occurred_at >= from_]
+            preds.append(lambda e: e.occurred_at >= from_)
         if to:
-            items = [e for e in items if e.occurred_at < to]
+            preds.append(lambda e: e.occurred_at < to)
         if time_:
-            items = [e for e in items if e.occurred_at == time_]
-        return items
+            preds.append(lambda e: e.occurred_at == time_)
+        return preds
+
+    @classmethod
+    def find(cls, items, name=None, description=None, modified_since=None,
+             resource_id=None, status=None, from_=None, to=None, time_=None) -> list:
+        if isinstance(status, str):
+            status = Status(status)
+        if isinstance(items, IndexedCollection):
+            items = items.select(name=name, modified_since=cls.normalize_dt(modified_since), resource_id=resource_id, status=status)
+        return cls._filter(items, cls._predicates(name=name, description=description, modified_since=modified_since,
+                                                  resource_id=resource_id, status=status, from_=from_, to=to, time_=time_))
 
 
-class IncidentType(enum.Enum):
+class IncidentType(str, enum.Enum):
     planned = "planned"
     unplanned = "unplanned"
     reservation = "reservation"
 
 
-class Resolution(enum.Enum):
+class Resolution(str, enum.Enum):
     unresolved = "unresolved"
     cancelled = "cancelled"
     completed = "completed"
@@ -164,38 +180,45 @@ class Incident(NamedObject):
     @property
     def event_uris(self) -> list[str]:
         """ Return the list of event URIs for this incident. """
-        return [f"{config.API_URL_ROOT}{config.API_PREFIX}{config.API_URL}/status/incidents/{self.id}/events/{e}" for e in self.event_ids]
+        return [f"{config.API_BASE_URL}/status/incidents/{self.id}/events/{e}" for e in self.event_ids]
 
     @computed_field(description="The list of resources that may be impacted by this incident")
     @property
     def resource_uris(self) -> list[str]:
         """ Return the list of resource URIs for this incident. """
-        return [f"{config.API_URL_ROOT}{config.API_PREFIX}{config.API_URL}/status/resources/{r}" for r in self.resource_ids]
+        return [f"{config.API_BASE_URL}/status/resources/{r}" for r in self.resource_ids]
 
     @classmethod
-    def find(cls, items, name=None, description=None, modified_since=None, status=None,
-             type_=None, from_= None, to = None, time_ = None, resource_id = None, resolution=None) -> list:
-        items = super().find(items, name=name, description=description, modified_since=modified_since)
-
+    def _predicates(cls, name=None, description=None, modified_since=None, status=None,
+                    type_=None, from_= None, to = None, time_ = None, resource_id = None, resolution=None):
+        preds = super()._predicates(name=name, description=description, modified_since=modified_since)
         if resource_id:
-            items = [e for e in items if resource_id in e.resource_ids]
+            preds.append(lambda e: resource_id in e.resource_ids)
         if status:
-            items = [e for e in items if e.status == status]
+            preds.append(lambda e: e.status == status)
         if type_:
-            items = [e for e in items if e.type == type_]
+            preds.append(lambda e: e.type == type_)
         if resolution:
-            items = [e for e in items if e.resolution == resolution]
+            preds.append(lambda e: e.resolution == resolution)
 
         from_ = cls.normalize_dt(from_) if from_ else None
         to = cls.normalize_dt(to) if to else None
         time_ = cls.normalize_dt(time_) if time_ else None
 
         if from_:
-            items = [e for e in items if e.start >= from_]
+            preds.append(lambda e: e.start >= from_)
         if to:
-            items = [e for e in items if e.end and e.end < to]
-
+            preds.append(lambda e: bool(e.end) and e.end < to)
         if time_:
-            items = [e for e in items
-                     if e.start <= time_ and (e.end is None or e.end > time_)]
-        return items
\ No newline at end of file
+            preds.append(lambda e: e.start <= time_ and (e.end is None or e.end > time_))
+        return preds
+
+    @classmethod
+    def find(cls, items, name=None, description=None, modified_since=None, status=None,
+             type_=None, from_= None, to = None, time_ = None, resource_id = None, resolution=None) -> list:
+        if isinstance(items, IndexedCollection):
+            items = items.select(name=name, modified_since=cls.normalize_dt(modified_since), status=status, type=type_,
+                                 resolution=resolution, resource_ids=resource_id)
+        return cls._filter(items, cls._predicates(name=name, description=description, modified_since=modified_since, status=status,
+                                                  type_=type_, from_=from_, to=to, time_=time_, resource_id=resource_id,
+                                                  resolution=resolution))
@@ -1,11 +1,12 @@
 from typing import Annotated, List, Optional
 
-from fastapi import Depends, HTTPException, Query, Request
+from fastapi import Depends, Query, Request
 
+from ...types.cache import cache_response, conditional_response
 from ...types.http import forbidExtraQueryParams
 from ...types.scalars import AllocationUnit, StrictDateTime
 from .. import iri_router
-from ..error_handlers import DEFAULT_RESPONSES
+from ..error_handlers import DEFAULT_RESPONSES, NotFound
 from . import facility_adapter, models
 
 router = iri_router.IriRouter(
@@ -22,6 +23,7 @@ router = iri_router.IriRouter(
     operation_id="getResources",
     response_model_exclude_none=True
 )
+@cache_response(ttl="short", exclude_none=True)
 async def get_resources(
     request : Request,
     name : str = Query(default=None, min_length=1),
@@ -46,13 +48,14 @@ async def get_resources(
     responses=DEFAULT_RESPONSES,
     operation_id="getResource",
 )
+@conditional_response()
 async def get_resource(
     request : Request,
     resource_id : str,
     ) -> models.Resource:
     item = await router.adapter.get_resource(resource_id)
     if not item:
-        raise HTTPException(status_code=404, detail="Item not found")
+        raise NotFound()
     return item
 
 
@@ -63,6 +66,7 @@ async def get_resource(
     responses=DEFAULT_RESPONSES,
     operation_id="getIncidents",
 )
+@cache_response(ttl="short")
 async def get_incidents(
     request : Request,
     name : str = Query(default=None, min_length=1),
@@ -92,13 +96,14 @@ async def get_incidents(
     operation_id="getIncident",
 
 )
+@conditional_response()
 async def get_incident(
     request : Request,
     incident_id : str
     ) -> models.Incident:
     item = await router.adapter.get_incident(incident_id)
     if not item:
-        raise HTTPException(status_code=404, detail="Item not found")
+        raise NotFound()
     return item
 
 
@@ -109,6 +114,7 @@ async def get_incident(
     responses=DEFAULT_RESPONSES,
     operation_id="getEventsByIncident",
 )
+@cache_response(ttl="short")
 async def get_events(
     request : Request,
     incident_id : str,
@@ -135,6 +141,7 @@ async def get_events(
     responses=DEFAULT_RESPONSES,
     operation_id="getEventByIncident",
 )
+@conditional_response()
 async def get_event(
     request : Request,
     incident_id : str,
@@ -142,5 +149,5 @@ async def get_event(
     ) -> models.Event:
     item = await router.adapter.get_event(incident_id, event_id)
     if not item:
-        raise HTTPException(status_code=404, detail="Item not found")
+        raise NotFound()
     return item
@@ -1,11 +1,53 @@
+import asyncio
+import functools
 from abc import abstractmethod
+from ... import config
 from . import models as task_models
 from ..account import models as account_models
 from ..status import models as status_models
-from ..filesystem import models as filesystem_models, facility_adapter as filesystem_adapter
+from ..filesystem import facility_adapter as filesystem_adapter
 from ..iri_router import AuthenticatedAdapter, IriRouter
 
 
+@functools.cache
+def _get_adapter(router_name: str) -> filesystem_adapter.FacilityAdapter | None:
+    """The (shared) filesystem adapter instance, resolved on the first task."""
+    return IriRouter.create_adapter(router_name, filesystem_adapter.FacilityAdapter)
+
+
+def _dump_json(o) -> str:
+    return o.model_dump_json()
+
+
+# How the result of each filesystem command (the name of the filesystem adapter method too) becomes the task result
+_FS_RESULTS = {
+    "chmod": _dump_json,
+    "chown": _dump_json,
+    "file": _dump_json,
+    "stat": _dump_json,
+    "mkdir": _dump_json,
+    "symlink": _dump_json,
+    "ls": _dump_json,
+    "head": _dump_json,
+    "view": _dump_json,
+    "tail": _dump_json,
+    "checksum": _dump_json,
+    "rm": _dump_json,
+    "compress": _dump_json,
+    "extract": _dump_json,
+    "mv": _dump_json,
+    "cp": _dump_json,
+    "download": lambda o: o,
+    "upload": lambda o: "File uploaded successfully",
+}
+
+# the seconds each filesystem command may run, before the task fails
+_FS_TIMEOUTS = {
+    command: config.TASK_TIMEOUT_LONG if command in {"download", "upload", "cp", "mv", "compress", "extract", "rm"} else config.TASK_TIMEOUT
+    for command in _FS_RESULTS
+}
+
+
 class FacilityAdapter(AuthenticatedAdapter):
     """
     Facility-specific code is handled by the implementation of this interface.
@@ -20,6 +62,9 @@ class FacilityAdapter(AuthenticatedAdapter):
         user: account_models.User,
         task_id: str
         ) -> task_models.Task|None:
+        """
+            Return the user's task with the given id, or raise `NotFound` (from `app.routers.error_handlers`) if there is none.
+        """
         pass
 
 
@@ -51,72 +96,24 @@ class FacilityAdapter(AuthenticatedAdapter):
         # Returns: (result, status)
         try:
             r = None
-            if task.router == "filesystem":
-                fs_adapter = IriRouter.create_adapter(task.router, filesystem_adapter.FacilityAdapter)
-                if task.command == "chmod":
-                    request_model = filesystem_models.PutFileChmodRequest.model_validate(task.args["request_model"])
-                    o = await fs_adapter.chmod(resource, user, request_model)
-                    r = o.model_dump_json()
-                elif task.command == "chown":
-                    request_model = filesystem_models.PutFileChownRequest.model_validate(task.args["request_model"])
-                    o = await fs_adapter.chown(resource, user, request_model)
-                    r = o.model_dump_json()
-                elif task.command == "file":
-                    o = await fs_adapter.file(resource, user, **task.args)
-                    r = o.model_dump_json()
-                elif task.command == "stat":
-                    o = await fs_adapter.stat(resource, user, **task.args)
-                    r = o.model_dump_json()
-                elif task.command == "mkdir":
-                    request_model = filesystem_models.PostMakeDirRequest.model_validate(task.args["request_model"])
-                    o = await fs_adapter.mkdir(resource, user, request_model)
-                    r = o.model_dump_json()
-                elif task.command == "symlink":
-                    request_model = filesystem_models.PostFileSymlinkRequest.model_validate(task.args["request_model"])
-                    o = await fs_adapter.symlink(resource, user, request_model)
-                    r = o.model_dump_json()
-                elif task.command == "ls":
-                    o = await fs_adapter.ls(resource, user, **task.args)
-                    r = o.model_dump_json()
-                elif task.command == "head":
-                    o = await fs_adapter.head(resource, user, **task.args)
-                    r = o.model_dump_json()
-                elif task.command == "view":
-                    o = await fs_adapter.view(resource, user, **task.args)
-                    r = o.model_dump_json()
-                elif task.command == "tail":
-                    o = await fs_adapter.tail(resource, user, **task.args)
-                    r = o.model_dump_json()
-                elif task.command == "checksum":
-                    o = await fs_adapter.checksum(resource, user, **task.args)
-                    r = o.model_dump_json()
-                elif task.command == "rm":
-                    o = await fs_adapter.rm(resource, user, **task.args)
-                    r = o.model_dump_json()
-                elif task.command == "compress":
-                    request_model = filesystem_models.PostCompressRequest.model_validate(task.args["request_model"])
-                    o = await fs_adapter.compress(resource, user, request_model)
-                    r = o.model_dump_json()
-                elif task.command == "extract":
-                    request_model = filesystem_models.PostExtractRequest.model_validate(task.args["request_model"])
-                    o = await fs_adapter.extract(resource, user, request_model)
-                    r = o.model_dump_json()
-                elif task.command == "mv":
-                    request_model = filesystem_models.PostMoveRequest.model_validate(task.args["request_model"])
-                    o = await fs_adapter.mv(resource, user, request_model)
-                    r = o.model_dump_json()
-                elif task.command == "cp":
-                    request_model = filesystem_models.PostCopyRequest.model_validate(task.args["request_model"])
-                    o = await fs_adapter.cp(resource, user, request_model)
-                    r = o.model_dump_json()
-                elif task.command == "download":
-                    r = await fs_adapter.download(resource, user, **task.args)
-                elif task.command == "upload":
-                    o = await fs_adapter.upload(resource, user, **task.args)
-                    r = "File uploaded successfully"
+            if task.router == "filesystem" and task.command in _FS_RESULTS:
+                # the args are already validated (typed) by the command model: pass its fields as is
+                fs_adapter = _get_adapter(task.router)
+                # a hung command is cancelled rather than holding up the queue worker
+                deadline = asyncio.timeout(_FS_TIMEOUTS[task.command])
+                try:
+                    async with deadline:
+                        o = await getattr(fs_adapter, task.command)(resource, user, **dict(task.args))
+                except TimeoutError:
+                    # only our deadline is reported as such, a TimeoutError of the adapter itself is just an error
+                    if not deadline.expired():
+                        raise
+                    return (f"Error: {task.command} timed out after {_FS_TIMEOUTS[task.command]:g} seconds", task_models.TaskStatus.failed)
+                r = _FS_RESULTS[task.command](o)
             if r:
                 return (r, task_models.TaskStatus.completed)
             else:
                 return (f"Task was cancelled due to unknown router/command: {task.router}:{task.command}", task_models.TaskStatus.failed)
+        # (cancellation of the worker itself is not an Exception, so it still propagates)
         except Exception as exc:
             return (f"Error: {exc}", task_models.TaskStatus.failed)
@@ -1,5 +1,7 @@
 import enum
-from pydantic import BaseModel
+from typing import Annotated, Literal, Union
+from pydantic import BaseModel, ConfigDict, Field
+from ..filesystem import models as filesystem_models
 
 
 class TaskStatus(str, enum.Enum):
@@ -9,13 +11,156 @@ class TaskStatus(str, enum.Enum):
     failed = "failed"
     canceled = "canceled"
 
-class TaskCommand(BaseModel):
-    router: str
-    command: str
-    args: dict
+
+# The arguments of the filesystem commands,
+# passed as keyword arguments to the filesystem adapter method named after the command
+
+class CommandArgs(BaseModel):
+    # an unknown argument is a bug in the route building the command
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+class PathArgs(CommandArgs):
+    path: str
+
+class StatArgs(PathArgs):
+    dereference: bool
+
+class LsArgs(PathArgs):
+    show_hidden: bool
+    numeric_uid: bool
+    recursive: bool
+    dereference: bool
+
+class HeadArgs(PathArgs):
+    file_bytes: int|None=None
+    lines: int|None=None
+    skip_trailing: bool
+
+class TailArgs(PathArgs):
+    file_bytes: int|None=None
+    lines: int|None=None
+    skip_heading: bool
+
+class ViewArgs(PathArgs):
+    size: int
+    offset: int
+
+class UploadArgs(PathArgs):
+    content: str
+
+class ChmodArgs(CommandArgs):
+    request_model: filesystem_models.PutFileChmodRequest
+
+class ChownArgs(CommandArgs):
+    request_model: filesystem_models.PutFileChownRequest
+
+class MkdirArgs(CommandArgs):
+    request_model: filesystem_models.PostMakeDirRequest
+
+class SymlinkArgs(CommandArgs):
+    request_model: filesystem_models.PostFileSymlinkRequest
+
+class CompressArgs(CommandArgs):
+    request_model: filesystem_models.PostCompressRequest
+
+class ExtractArgs(CommandArgs):
+    request_model: filesystem_models.PostExtractRequest
+
+class MoveArgs(CommandArgs):
+    request_model: filesystem_models.PostMoveRequest
+
+class CopyArgs(CommandArgs):
+    request_model: filesystem_models.PostCopyRequest
+
+
+# The commands: each one is validated into its typed args once, when the task is created or read back from a queue
+
+class FilesystemCommand(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    router: Literal["filesystem"]="filesystem"
+
+class ChmodCommand(FilesystemCommand):
+    command: Literal["chmod"]="chmod"
+    args: ChmodArgs
+
+class ChownCommand(FilesystemCommand):
+    command: Literal["chown"]="chown"
+    args: ChownArgs
+
+class FileCommand(FilesystemCommand):
+    command: Literal["file"]="file"
+    args: PathArgs
+
+class StatCommand(FilesystemCommand):
+    command: Literal["stat"]="stat"
+    args: StatArgs
+
+class MkdirCommand(FilesystemCommand):
+    command: Literal["mkdir"]="mkdir"
+    args: MkdirArgs
+
+class SymlinkCommand(FilesystemCommand):
+    command: Literal["symlink"]="symlink"
+    args: SymlinkArgs
+
+class LsCommand(FilesystemCommand):
+    command: Literal["ls"]="ls"
+    args: LsArgs
+
+class HeadCommand(FilesystemCommand):
+    command: Literal["head"]="head"
+    args: HeadArgs
+
+class ViewCommand(FilesystemCommand):
+    command: Literal["view"]="view"
+    args: ViewArgs
+
+class TailCommand(FilesystemCommand):
+    command: Literal["tail"]="tail"
+    args: TailArgs
+
+class ChecksumCommand(FilesystemCommand):
+    command: Literal["checksum"]="checksum"
+    args: PathArgs
+
+class RmCommand(FilesystemCommand):
+    command: Literal["rm"]="rm"
+    args: PathArgs
+
+class CompressCommand(FilesystemCommand):
+    command: Literal["compress"]="compress"
+    args: CompressArgs
+
+class ExtractCommand(FilesystemCommand):
+    command: Literal["extract"]="extract"
+    args: ExtractArgs
+
+class MoveCommand(FilesystemCommand):
+    command: Literal["mv"]="mv"
+    args: MoveArgs
+
+class CopyCommand(FilesystemCommand):
+    command: Literal["cp"]="cp"
+    args: CopyArgs
+
+class DownloadCommand(FilesystemCommand):
+    command: Literal["download"]="download"
+    args: PathArgs
+
+class UploadCommand(FilesystemCommand):
+    command: Literal["upload"]="upload"
+    args: UploadArgs
+
+
+TaskCommand = Annotated[
+    Union[ChmodCommand, ChownCommand, FileCommand, StatCommand, MkdirCommand, SymlinkCommand, LsCommand, HeadCommand, ViewCommand,
+          TailCommand, ChecksumCommand, RmCommand, CompressCommand, ExtractCommand, MoveCommand, CopyCommand, DownloadCommand, UploadCommand],
+    Field(discriminator="command"),
+]
 
 
 class Task(BaseModel):
+    model_config = ConfigDict(frozen=True)
     id: str
     status: TaskStatus=TaskStatus.pending
     result: str|None=None
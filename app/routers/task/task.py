@@ -1,6 +1,7 @@
-from fastapi import Request, HTTPException, Depends
+from fastapi import Request, Depends
 from .. import iri_router
-from ..error_handlers import DEFAULT_RESPONSES
+from ..account.models import User
+from ..error_handlers import DEFAULT_RESPONSES, NotFound
 from .import models, facility_adapter
 
 router = iri_router.IriRouter(
@@ -20,14 +21,12 @@ router = iri_router.IriRouter(
 async def get_task(
     request : Request,
     task_id : str,
+    user : User = Depends(router.current_user_model),
     ) -> models.Task:
     """Get a task"""
-    user = await router.adapter.get_user(user_id=request.state.current_user_id, api_key=request.state.api_key, client_ip=iri_router.get_client_ip(request))
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
     task = await router.adapter.get_task(user=user, task_id=task_id)
     if not task:
-        raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
+        raise NotFound(f"Task {task_id} not found")
     return task
 
 
@@ -40,9 +39,7 @@ async def get_task(
 )
 async def get_tasks(
     request : Request,
+    user : User = Depends(router.current_user_model),
     ) -> list[models.Task]:
     """Get all tasks"""
-    user = await router.adapter.get_user(user_id=request.state.current_user_id, api_key=request.state.api_key, client_ip=iri_router.get_client_ip(request))
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
     return await router.adapter.get_tasks(user=user)
\ No newline at end of file
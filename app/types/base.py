@@ -1,10 +1,11 @@
 """Default models used by multiple routers."""
+import bisect
 import datetime
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Sequence
 from typing import Optional
 
 from pydantic import (BaseModel, ConfigDict, Field, computed_field,
-                      field_validator, model_serializer)
+                      model_serializer)
 
 from .. import config
 from .scalars import StrictDateTime
@@ -31,6 +32,57 @@ class IRIBaseModel(BaseModel):
         return getattr(self, "__pydantic_extra__", {}).get(key, default)
 
 
+class IndexedCollection(Sequence):
+    """
+        A read-only sequence of objects with equality indexes on some of their attributes and an ordering
+        on `last_modified`, so `find` can narrow down the candidates before filtering them one by one.
+        The indexed attributes of the items must not change once the collection is built.
+    """
+
+    def __init__(self, items: Iterable, indexed: Iterable[str] = ("name",), multi_indexed: Iterable[str] = ()):
+        self._items = list(items)
+        self._indexes: dict[str, dict] = {attr: {} for attr in indexed}
+        for pos, item in enumerate(self._items):
+            for attr, index in self._indexes.items():
+                index.setdefault(getattr(item, attr), []).append(pos)
+        # list attributes (eg. `resource_ids`): an item is found by any of the values it contains
+        for attr in multi_indexed:
+            index = self._indexes[attr] = {}
+            for pos, item in enumerate(self._items):
+                for value in dict.fromkeys(getattr(item, attr)):
+                    index.setdefault(value, []).append(pos)
+        dated = sorted((item.last_modified, pos) for pos, item in enumerate(self._items) if getattr(item, "last_modified", None))
+        self._modified = [dt for dt, _ in dated]
+        self._modified_pos = [pos for _, pos in dated]
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self):
+        return len(self._items)
+
+    def select(self, modified_since: datetime.datetime | None = None, **criteria) -> list:
+        """
+            Return the items (in their original order) whose indexed attributes equal (or, for multi-indexed
+            attributes, contain) the given values, and that were modified at or after `modified_since`.
+            Empty criteria and criteria on attributes that aren't indexed are ignored: the caller still filters on those.
+        """
+        positions = None
+        for attr, value in criteria.items():
+            if not value or attr not in self._indexes:
+                continue
+            matched = self._indexes[attr].get(value, ())
+            positions = set(matched) if positions is None else positions.intersection(matched)
+            if not positions:
+                return []
+        if modified_since:
+            matched = self._modified_pos[bisect.bisect_left(self._modified, modified_since):]
+            positions = set(matched) if positions is None else positions.intersection(matched)
+        if positions is None:
+            return list(self._items)
+        return [self._items[pos] for pos in sorted(positions)]
+
+
 class NamedObject(IRIBaseModel):
     """Base model for named objects."""
     id: str = Field(..., description="The unique identifier for the object. Typically a UUID or URN.")
@@ -38,8 +90,8 @@ class NamedObject(IRIBaseModel):
         raise NotImplementedError
 
     @classmethod
-    def normalize_dt(cls, dt: datetime | None) -> datetime | None:
-        """Normalize datetime to UTC-aware."""
+    def normalize_dt(cls, dt: datetime.datetime | str | None) -> datetime.datetime | None:
+        """Normalize datetime to UTC-aware. (`last_modified` needs no normalization: StrictDateTime already stores it UTC-aware.)"""
         # Convert naive datetimes into UTC-aware versions
         if dt is None:
             return None
@@ -49,16 +101,11 @@ class NamedObject(IRIBaseModel):
             return dt.replace(tzinfo=datetime.timezone.utc)
         return dt
 
-    @field_validator("last_modified", mode="before")
-    @classmethod
-    def _norm_dt_field(cls, v):
-        return cls.normalize_dt(v)
-
     @computed_field(description="The canonical URL of this object")
     @property
     def self_uri(self) -> str:
         """Computed self URI property."""
-        return f"{config.API_URL_ROOT}{config.API_PREFIX}{config.API_URL}{self._self_path()}"
+        return f"{config.API_BASE_URL}{self._self_path()}"
 
     name: Optional[str] = Field(None, description="The long name of the object.")
     description: Optional[str] = Field(None, description="Human-readable description of the object.")
@@ -78,24 +125,34 @@ class NamedObject(IRIBaseModel):
         return matches[0]
 
     @classmethod
-    def find(cls, items, name=None, description=None, modified_since=None):
-        """ Find objects matching the given criteria. """
-        single = False
-        if not any((name, description, modified_since)):
-            return items
-
-        if not isinstance(items, Iterable) or isinstance(items, BaseModel):
-            items = [items]
-            single = True
-
+    def _predicates(cls, name=None, description=None, modified_since=None) -> list[Callable]:
+        """ The tests of `find`, one per given criterion. Subclasses append the tests of their own criteria. """
+        preds = []
         if name:
-            items = [item for item in items if item.name == name]
+            preds.append(lambda item: item.name == name)
         if description:
-            items = [item for item in items if item.description and description in item.description]
+            preds.append(lambda item: bool(item.description) and description in item.description)
         if modified_since:
             modified_since = cls.normalize_dt(modified_since)
-            items = [item for item in items
-                     if item.last_modified and item.last_modified >= modified_since]
-        if single:
-            return items[0] if items else None
-        return items
+            preds.append(lambda item: bool(item.last_modified) and item.last_modified >= modified_since)
+        return preds
+
+    @staticmethod
+    def _filter(items, preds: list[Callable]):
+        """ Return the items passing every test, in a single pass over them. A single object is returned if it passes, else None. """
+        if isinstance(items, BaseModel) or not isinstance(items, Iterable):
+            found = NamedObject._filter([items], preds)
+            return found[0] if found else None
+        if not preds:
+            return list(items) if isinstance(items, IndexedCollection) else items
+        if len(preds) == 1:
+            pred = preds[0]
+            return [item for item in items if pred(item)]
+        return [item for item in items if all(pred(item) for pred in preds)]
+
+    @classmethod
+    def find(cls, items, name=None, description=None, modified_since=None):
+        """ Find objects matching the given criteria. """
+        if isinstance(items, IndexedCollection):
+            items = items.select(name=name, modified_since=cls.normalize_dt(modified_since))
+        return cls._filter(items, cls._predicates(name=name, description=description, modified_since=modified_since))
@@ -0,0 +1,378 @@
+"""Response cache for rarely changing, unauthenticated endpoints"""
+import asyncio
+import collections
+import dataclasses
+import datetime
+import functools
+import hashlib
+import logging
+import math
+import time
+import typing
+import urllib.parse
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import HTTPException, Request, Response
+from pydantic import TypeAdapter
+
+from .. import config
+
+# -----------------------------------------------------------------------
+# CacheEntry: a rendered response body and its validators, as stored by the cache backends
+
+@dataclasses.dataclass
+class CacheEntry:
+    """A cached response body with its validators."""
+    body: bytes
+    etag: str
+    last_modified: str | None  # RFC1123 date of the newest object in the body, if it has any
+    generated_at: float  # epoch seconds
+    stale_at: float  # epoch seconds; after this the entry is still served, but refreshed in the background
+    hard_expire_at: float  # epoch seconds; after this the entry is gone
+
+    def to_hash(self) -> dict[str, bytes | str]:
+        """Flatten the entry into a redis hash."""
+        return {
+            "body": self.body,
+            "etag": self.etag,
+            "last_modified": self.last_modified or "",
+            "generated_at": repr(self.generated_at),
+            "stale_at": repr(self.stale_at),
+            "hard_expire_at": repr(self.hard_expire_at),
+        }
+
+    @classmethod
+    def from_hash(cls, data: dict[bytes, bytes]) -> "CacheEntry":
+        """Rebuild an entry from a redis hash."""
+        return cls(
+            body=data[b"body"],
+            etag=data[b"etag"].decode(),
+            last_modified=data[b"last_modified"].decode() or None,
+            generated_at=float(data[b"generated_at"]),
+            stale_at=float(data[b"stale_at"]),
+            hard_expire_at=float(data[b"hard_expire_at"]),
+        )
+
+# -----------------------------------------------------------------------
+# Cache backends: an in-process LRU (the default) and redis (shared by every worker, if REDIS_URL is set)
+
+class MemoryCacheBackend:
+    """A size-bounded, least-recently-used in-process cache."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: collections.OrderedDict[str, tuple[float, CacheEntry]] = collections.OrderedDict()
+        self._locks: dict[str, float] = {}
+
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Return the entry stored under key, or None if it's missing or expired."""
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, entry = item
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+
+    async def set(self, key: str, entry: CacheEntry, ttl: float):
+        """Store entry under key for ttl seconds, evicting the least recently used entries if full."""
+        self._entries[key] = (time.time() + ttl, entry)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+    async def invalidate(self, prefix: str):
+        """Drop every entry whose key starts with prefix."""
+        for key in [k for k in self._entries if k.startswith(prefix)]:
+            del self._entries[key]
+
+
+    async def lock(self, key: str, ttl: float) -> bool:
+        """Take the refresh lock of key for at most ttl seconds. Returns False if it's already taken."""
+        now = time.time()
+        if self._locks.get(key, 0) > now:
+            return False
+        self._locks[key] = now + ttl
+        return True
+
+
+    async def unlock(self, key: str):
+        """Release the refresh lock of key."""
+        self._locks.pop(key, None)
+
+
+    async def close(self):
+        """Nothing to release for the in-process cache."""
+
+
+class RedisCacheBackend:
+    """A cache kept in redis hashes, so all the api workers share it."""
+
+    def __init__(self, url: str):
+        # redis is an optional dependency (pip install .[redis]), only needed when REDIS_URL is set
+        import redis.asyncio  # pylint: disable=import-outside-toplevel
+        self.redis = redis.asyncio.Redis.from_url(url)
+
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Return the entry stored under key, or None if it's missing or expired."""
+        data = await self.redis.hgetall(key)
+        return CacheEntry.from_hash(data) if data else None
+
+
+    async def set(self, key: str, entry: CacheEntry, ttl: float):
+        """Store entry under key for ttl seconds."""
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=entry.to_hash())
+            pipe.expire(key, max(1, math.ceil(ttl)))
+            await pipe.execute()
+
+
+    async def invalidate(self, prefix: str):
+        """Drop every entry whose key starts with prefix."""
+        keys = [key async for key in self.redis.scan_iter(match=f"{prefix}*", count=500)]
+        if keys:
+            await self.redis.delete(*keys)
+
+
+    async def lock(self, key: str, ttl: float) -> bool:
+        """Take the refresh lock of key for at most ttl seconds. Returns False if it's already taken (by any worker)."""
+        return bool(await self.redis.set(f"{LOCK_PREFIX}{key}", 1, nx=True, ex=max(1, math.ceil(ttl))))
+
+
+    async def unlock(self, key: str):
+        """Release the refresh lock of key."""
+        await self.redis.delete(f"{LOCK_PREFIX}{key}")
+
+
+    async def close(self):
+        """Close the redis connection pool."""
+        await self.redis.aclose()
+
+
+RESPONSE_CACHE = RedisCacheBackend(config.REDIS_URL) if config.REDIS_URL else MemoryCacheBackend(config.RESPONSE_CACHE_MAXSIZE)
+
+# ttl (in seconds) of each cache policy
+CACHE_TTL_POLICIES = {
+    "short": config.RESPONSE_CACHE_TTL_SHORT,
+    "normal": config.RESPONSE_CACHE_TTL,
+    "long": config.RESPONSE_CACHE_TTL_LONG,
+}
+
+KEY_PREFIX = "iri:"
+LOCK_PREFIX = "iri:lock:"
+
+# an expired entry is served while it's refreshed for at most this fraction of its policy's ttl (or RESPONSE_CACHE_STALE_TTL
+# if that's shorter), so the short-lived status lists stay nearly as fresh as their ttl promises
+STALE_TTL_FRACTION = 0.5
+
+# how long a background refresh may hold its lock, so a hung adapter call doesn't block refreshes forever
+REFRESH_LOCK_TTL = 30
+
+# strong references to the running background refreshes (the event loop only keeps weak ones)
+_refresh_tasks: set[asyncio.Task] = set()
+
+
+def cache_key(request: Request) -> str:
+    """The cache key of a request: its path and its (order-independent) query string."""
+    # re-encoded, so a "&", "=" or "?" inside a value (or the path) can't make two requests share a key
+    query = urllib.parse.urlencode(sorted(request.query_params.multi_items()))
+    return f"{KEY_PREFIX}{urllib.parse.quote(request.url.path)}?{query}"
+
+
+async def invalidate(path_prefix: str = ""):
+    """
+        Drop the cached responses of every path starting with `path_prefix` (eg. "/api/v1/facility").
+        Adapters that change facility data should call this so the change is visible before the ttl runs out.
+    """
+    await RESPONSE_CACHE.invalidate(f"{KEY_PREFIX}{urllib.parse.quote(path_prefix)}")
+
+
+def _http_date(dt: datetime.datetime) -> str:
+    """Format an (aware) datetime, whatever its utc offset, as an http date."""
+    return format_datetime(dt.astimezone(datetime.timezone.utc), usegmt=True)
+
+
+def _last_modified(result) -> str | None:
+    """The http date of the newest `last_modified` among the returned object(s), if any."""
+    items = result if isinstance(result, list) else [result]
+    dates = [dt for dt in (getattr(item, "last_modified", None) for item in items) if dt is not None]
+    return _http_date(max(dates)) if dates else None
+
+
+def _headers(entry: CacheEntry) -> dict[str, str]:
+    """The validator headers of a cached response."""
+    headers = {"ETag": entry.etag}
+    if entry.last_modified:
+        headers["Last-Modified"] = entry.last_modified
+    return headers
+
+
+def _not_modified(request: Request, etag: str, last_modified: str | None) -> bool:
+    """Whether the client's conditional headers show it already has this version (If-None-Match takes precedence)."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # weak comparison: W/"x" matches "x"
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag.removeprefix("W/") in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            # an invalid date is ignored, as per RFC 9110
+            return False
+    return False
+
+
+def cache_response(ttl: str | float = "normal", exclude_none: bool = False):
+    """
+        Cache the json body returned by an endpoint, and answer conditional requests
+        (If-None-Match / If-Modified-Since) from the cached ETag and Last-Modified with a 304.
+        `ttl` is either a policy name ("short", "normal" or "long", see CACHE_TTL_POLICIES) or a number of seconds.
+        Once an entry is older than `ttl` it is still served for RESPONSE_CACHE_STALE_TTL more seconds
+        (at most STALE_TTL_FRACTION of `ttl`) while a single background task (per key, across workers) refreshes it.
+        With IRI_CACHE_FALLBACK enabled, an expired entry is also served (with a `Warning: 110` header)
+        when the endpoint fails, for up to RESPONSE_CACHE_FALLBACK_TTL seconds after it expired.
+        The endpoint must take a `request: Request` parameter and must not depend on the current user.
+        Set `exclude_none` to match the route's `response_model_exclude_none`.
+        With RESPONSE_CACHE_ENABLED off nothing is cached, but the body is still rendered straight to json bytes.
+    """
+    def decorator(func):
+        # compiled once per endpoint, and reused to render every response
+        adapter = TypeAdapter(typing.get_type_hints(func)["return"])
+
+        def validate(result):
+            return adapter.validate_python(result, from_attributes=True)
+
+        def dump(result) -> bytes:
+            return adapter.dump_json(result, by_alias=True, exclude_none=exclude_none)
+
+        if not config.RESPONSE_CACHE_ENABLED:
+            @functools.wraps(func)
+            async def uncached(*args, **kwargs):
+                result = await func(*args, **kwargs)
+                if isinstance(result, Response):
+                    return result
+                return Response(content=dump(validate(result)), media_type="application/json")
+            return uncached
+
+        seconds = CACHE_TTL_POLICIES[ttl] if isinstance(ttl, str) else ttl
+        stale_seconds = min(config.RESPONSE_CACHE_STALE_TTL, seconds * STALE_TTL_FRACTION)
+
+        def render(result) -> CacheEntry:
+            result = validate(result)
+            body = dump(result)
+            now = time.time()
+            return CacheEntry(body=body, etag=f'W/"{hashlib.sha1(body, usedforsecurity=False).hexdigest()}"', last_modified=_last_modified(result),
+                              generated_at=now, stale_at=now + seconds, hard_expire_at=now + seconds + stale_seconds)
+
+        async def store(key: str, entry: CacheEntry):
+            # with the fallback enabled, entries are kept past their hard expiry to be served if the adapter fails
+            keep_for = entry.hard_expire_at - entry.generated_at + (config.RESPONSE_CACHE_FALLBACK_TTL if config.CACHE_FALLBACK else 0)
+            try:
+                await RESPONSE_CACHE.set(key, entry, keep_for)
+            except Exception as exc:
+                logging.getLogger().warning(f"Response cache update failed: {exc}")
+
+        async def refresh(key: str, args, kwargs):
+            try:
+                result = await func(*args, **kwargs)
+                if not isinstance(result, Response):
+                    await store(key, render(result))
+            except Exception as exc:
+                # keep serving the stale entry, the next request after the lock expires retries
+                logging.getLogger().warning(f"Response cache refresh of {key} failed: {exc}")
+            finally:
+                try:
+                    await RESPONSE_CACHE.unlock(key)
+                except Exception as exc:
+                    logging.getLogger().warning(f"Response cache unlock failed: {exc}")
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            request = kwargs["request"]
+            key = cache_key(request)
+            try:
+                entry = await RESPONSE_CACHE.get(key)
+            except Exception as exc:
+                # a cache outage shouldn't take the api down with it
+                logging.getLogger().warning(f"Response cache lookup failed: {exc}")
+                entry = None
+            now = time.time()
+            headers = {}
+            if entry is None or entry.hard_expire_at <= now:
+                try:
+                    result = await func(*args, **kwargs)
+                except HTTPException:
+                    # a deliberate answer (404, 304, ...), not a failure of the adapter
+                    raise
+                except Exception as exc:
+                    if entry is None:
+                        raise
+                    # only reachable with IRI_CACHE_FALLBACK, otherwise expired entries aren't kept
+                    logging.getLogger().warning(f"Serving stale cached response for {key}: {exc}")
+                    headers["Warning"] = '110 - "Response is Stale"'
+                else:
+                    if isinstance(result, Response):
+                        return result
+                    entry = render(result)
+                    await store(key, entry)
+            elif entry.stale_at <= now:
+                try:
+                    locked = await RESPONSE_CACHE.lock(key, REFRESH_LOCK_TTL)
+                except Exception as exc:
+                    logging.getLogger().warning(f"Response cache lock failed: {exc}")
+                    locked = False
+                if locked:
+                    task = asyncio.create_task(refresh(key, args, kwargs))
+                    _refresh_tasks.add(task)
+                    task.add_done_callback(_refresh_tasks.discard)
+            headers.update(_headers(entry))
+            if _not_modified(request, entry.etag, entry.last_modified):
+                raise HTTPException(status_code=304, headers=headers)
+            return Response(content=entry.body, media_type="application/json", headers=headers)
+
+        return wrapper
+    return decorator
+
+
+def conditional_response(max_age: int | None = None):
+    """
+        Answer conditional GETs of a single object without caching it: the ETag is derived from the object's
+        `id` and `last_modified`, so a client whose copy is current (If-None-Match / If-Modified-Since) gets a 304
+        and the object isn't serialized at all. Responses also carry `Cache-Control: max-age` (in seconds,
+        defaults to CONDITIONAL_GET_MAX_AGE) so polling clients can skip requests altogether.
+        Only correct for adapters that update `last_modified` whenever the object changes, so it is a no-op
+        unless CONDITIONAL_GET_ENABLED is set. The endpoint must take a `request: Request` parameter.
+    """
+    def decorator(func):
+        if not config.CONDITIONAL_GET_ENABLED:
+            return func
+
+        adapter = TypeAdapter(typing.get_type_hints(func)["return"])
+        cache_control = f"max-age={config.CONDITIONAL_GET_MAX_AGE if max_age is None else max_age}"
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            result = await func(*args, **kwargs)
+            if isinstance(result, Response):
+                return result
+            version = f"{result.id}:{result.last_modified.isoformat()}"
+            headers = {
+                "ETag": f'"{hashlib.blake2b(version.encode(), digest_size=8).hexdigest()}"',
+                "Last-Modified": _http_date(result.last_modified),
+                "Cache-Control": cache_control,
+            }
+            if _not_modified(kwargs["request"], headers["ETag"], headers["Last-Modified"]):
+                raise HTTPException(status_code=304, headers=headers)
+            body = adapter.dump_json(adapter.validate_python(result, from_attributes=True), by_alias=True)
+            return Response(content=body, media_type="application/json", headers=headers)
+
+        return wrapper
+    return decorator
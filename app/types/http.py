@@ -1,7 +1,7 @@
 """HTTP-related types and utilities for the IRI Facility API"""
 import datetime
+import functools
 from email.utils import parsedate_to_datetime
-from urllib.parse import parse_qs
 
 from fastapi import HTTPException, Request, status
 
@@ -62,18 +62,30 @@ def modifiedSinceDatetime(
 
 def forbidExtraQueryParams(*allowedParams: str, multiParams: set[str] | None = None):
     """Dependency to forbid extra query parameters. If allowedParams contains "*", all params are allowed."""
-    multiParams = multiParams or set()
+    # routes with the same allowlist share one (cached) dependency
+    return _query_params_checker(frozenset(allowedParams), frozenset(multiParams or ()))
 
-    async def checker(req: Request):
-        if "*" in allowedParams:
+
+@functools.cache
+def _query_params_checker(allowed: frozenset[str], multiParams: frozenset[str]):
+    """Build the dependency checking the query parameters against the allowed (and repeatable) names."""
+    if "*" in allowed:
+        async def allow_all():
             return
+        return allow_all
 
-        raw_qs = req.scope.get("query_string", b"")
-        parsed = parse_qs(raw_qs.decode("utf-8", errors="strict"), keep_blank_values=True)
+    async def checker(req: Request):
+        # the query string is already parsed (and cached on the request) for the endpoint's own parameters
+        params = req.query_params
+        if not params:
+            return
 
-        allowed = set(allowedParams)
+        # fast path: a set comparison, and no key given twice, decide the common, valid case
+        keys = params.keys()
+        if keys <= allowed and len(params.multi_items()) == len(keys):
+            return
 
-        for key, values in parsed.items():
+        for key in keys:
             if key not in allowed:
                 raise HTTPException(status_code=422,
                                     detail=[{"type": "extra_forbidden",
@@ -81,10 +93,27 @@ def forbidExtraQueryParams(*allowedParams: str, multiParams: set[str] | None = N
                                              "msg": f"Unexpected query parameter: {key}"}])
 
 
-            if len(values) > 1 and key not in multiParams:
-                raise HTTPException(status_code=422,
-                                    detail=[{"type": "duplicate_forbidden",
-                                             "loc": ["query", key],
-                                             "msg": f"Duplicate query parameter: {key}"}])
+            if key not in multiParams and len(params.getlist(key)) > 1:
+                _raise_duplicate(key)
 
     return checker
+
+# -----------------------------------------------------------------------
+# forbidRepeatedQueryParams: the duplicate check alone, for routes whose parameter model forbids extra keys
+# (a query parameter model only gets the last value of a repeated single-valued key, so it can't see duplicates)
+
+async def forbidRepeatedQueryParams(req: Request):
+    """Dependency to forbid repeating a query parameter."""
+    params = req.query_params
+    if len(params.multi_items()) == len(params):
+        return
+    for key in params.keys():
+        if len(params.getlist(key)) > 1:
+            _raise_duplicate(key)
+
+
+def _raise_duplicate(key: str):
+    raise HTTPException(status_code=422,
+                        detail=[{"type": "duplicate_forbidden",
+                                 "loc": ["query", key],
+                                 "msg": f"Duplicate query parameter: {key}"}])
@@ -2,7 +2,9 @@
 # pylint: disable=unused-argument
 import datetime
 import enum
+from typing import Annotated
 
+from pydantic import StringConstraints, WithJsonSchema
 from pydantic_core import core_schema
 
 # -----------------------------------------------------------------------
@@ -87,6 +89,17 @@ class StrictDateTime:
             "description": "Strict ISO8601 datetime. Only valid ISO8601 datetime strings are accepted."
         }
 
+# -----------------------------------------------------------------------
+# Uri: a link built by the api itself
+
+# Unlike HttpUrl, this isn't parsed: the links are generated by the facility, not submitted by clients,
+# so only the length is checked. The openapi schema stays the same as HttpUrl's.
+Uri = Annotated[
+    str,
+    StringConstraints(min_length=1, max_length=2083),
+    WithJsonSchema({"type": "string", "format": "uri", "minLength": 1, "maxLength": 2083}),
+]
+
 # -----------------------------------------------------------------------
 # AllocationUnit: an enum for allocation units
 
@@ -0,0 +1,47 @@
+"""Tests of the account endpoints"""
+import os
+import unittest
+
+os.environ.setdefault("IRI_SHOW_MISSING_ROUTES", "true")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.main import APP  # noqa: E402
+
+LONG_AGO = "2000-01-01T00:00:00Z"
+FUTURE = "2100-01-01T00:00:00Z"
+
+
+class CapabilitiesModifiedSinceTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = TestClient(APP)
+        cls.capabilities = cls.client.get("/api/v1/account/capabilities").json()
+
+    def test_list(self):
+        self.assertTrue(self.capabilities)
+        response = self.client.get("/api/v1/account/capabilities", params={"modified_since": LONG_AGO})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), self.capabilities)
+        response = self.client.get("/api/v1/account/capabilities", params={"modified_since": FUTURE})
+        self.assertEqual(response.json(), [])
+
+    def test_single_modified(self):
+        capability = self.capabilities[0]
+        response = self.client.get(f"/api/v1/account/capabilities/{capability['id']}", params={"modified_since": LONG_AGO})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["id"], capability["id"])
+
+    def test_single_not_modified(self):
+        capability = self.capabilities[0]
+        response = self.client.get(f"/api/v1/account/capabilities/{capability['id']}", params={"modified_since": FUTURE})
+        self.assertEqual(response.status_code, 304)
+
+    def test_single_missing(self):
+        response = self.client.get("/api/v1/account/capabilities/nope", params={"modified_since": LONG_AGO})
+        self.assertEqual(response.status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+"""Tests of the response cache (app.types.cache)"""
+import asyncio
+import datetime
+import os
+import types
+import unittest
+from unittest import mock
+
+os.environ.setdefault("IRI_SHOW_MISSING_ROUTES", "true")
+
+from fastapi import HTTPException, Request  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+
+from app.main import APP  # noqa: E402
+from app.routers.facility import facility  # noqa: E402
+from app.types import cache  # noqa: E402
+
+PLUS_TWO = datetime.timezone(datetime.timedelta(hours=2))
+
+
+class LastModifiedTest(unittest.TestCase):
+
+    def test_utc(self):
+        item = types.SimpleNamespace(last_modified=datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc))
+        self.assertEqual(cache._last_modified(item), "Thu, 02 Jan 2025 03:04:05 GMT")
+
+    def test_offset_is_converted_to_utc(self):
+        item = types.SimpleNamespace(last_modified=datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=PLUS_TWO))
+        self.assertEqual(cache._last_modified(item), "Thu, 02 Jan 2025 01:04:05 GMT")
+
+    def test_newest_of_mixed_offsets(self):
+        items = [types.SimpleNamespace(last_modified=datetime.datetime(2025, 1, 2, 3, 0, tzinfo=PLUS_TWO)),    # 01:00 utc
+                 types.SimpleNamespace(last_modified=datetime.datetime(2025, 1, 2, 2, 0, tzinfo=datetime.timezone.utc)),
+                 types.SimpleNamespace(last_modified=None)]
+        self.assertEqual(cache._last_modified(items), "Thu, 02 Jan 2025 02:00:00 GMT")
+
+    def test_no_dates(self):
+        self.assertIsNone(cache._last_modified([types.SimpleNamespace()]))
+
+
+class CacheKeyTest(unittest.TestCase):
+
+    @staticmethod
+    def key(path, query=b""):
+        request = _request()
+        request.scope["path"] = path
+        request.scope["query_string"] = query
+        return cache.cache_key(request)
+
+    def test_escaped_values_get_their_own_key(self):
+        self.assertNotEqual(self.key("/r", b"group=perlmutter%26name%3Dcompute%20nodes"),
+                            self.key("/r", b"group=perlmutter&name=compute%20nodes"))
+
+    def test_escaped_path_gets_its_own_key(self):
+        self.assertNotEqual(self.key("/r?a=1"), self.key("/r", b"a=1"))
+
+    def test_order_independent(self):
+        self.assertEqual(self.key("/r", b"a=1&b=2&a=0"), self.key("/r", b"b=2&a=0&a=1"))
+
+
+class CachedSiteTest(unittest.TestCase):
+
+    def setUp(self):
+        self.adapter = facility.router.adapter
+        self.sites = self.adapter.sites
+        asyncio.run(cache.invalidate())
+
+    def tearDown(self):
+        self.adapter.sites = self.sites
+        asyncio.run(cache.invalidate())
+
+    def test_site_with_offset_last_modified(self):
+        site = self.sites[0].model_copy(update={"last_modified": datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=PLUS_TWO)})
+        self.adapter.sites = [site, *self.sites[1:]]
+        with TestClient(APP) as client:
+            response = client.get(f"/api/v1/facility/sites/{site.id}")
+        self.assertEqual(response.status_code, 200)
+        if cache.config.RESPONSE_CACHE_ENABLED:
+            self.assertEqual(response.headers["Last-Modified"], "Thu, 02 Jan 2025 01:04:05 GMT")
+
+
+class StaleWindowTest(unittest.TestCase):
+
+    def entry_of(self, ttl):
+        @cache.cache_response(ttl=ttl)
+        async def get_item(request: Request) -> Item:
+            return Item(id="x", last_modified=datetime.datetime(2025, 1, 2, tzinfo=datetime.timezone.utc))
+        request = _request()
+        request.scope["path"] = f"/stale/{ttl}"
+        asyncio.run(cache.invalidate("/stale/"))
+        asyncio.run(get_item(request=request))
+        return asyncio.run(cache.RESPONSE_CACHE.get(cache.cache_key(request)))
+
+    @unittest.skipUnless(cache.config.RESPONSE_CACHE_ENABLED, "the response cache is disabled")
+    def test_stale_window_follows_the_policy(self):
+        for ttl, seconds in cache.CACHE_TTL_POLICIES.items():
+            with self.subTest(ttl=ttl):
+                entry = self.entry_of(ttl)
+                self.assertAlmostEqual(entry.stale_at - entry.generated_at, seconds)
+                self.assertAlmostEqual(entry.hard_expire_at - entry.stale_at,
+                                       min(cache.config.RESPONSE_CACHE_STALE_TTL, seconds * cache.STALE_TTL_FRACTION))
+
+    @unittest.skipUnless(cache.config.RESPONSE_CACHE_ENABLED, "the response cache is disabled")
+    def test_short_policy_stays_fresh(self):
+        entry = self.entry_of("short")
+        self.assertLessEqual(entry.hard_expire_at - entry.generated_at, 1.5 * cache.CACHE_TTL_POLICIES["short"])
+
+
+class Item(BaseModel):
+    id: str
+    last_modified: datetime.datetime
+
+
+def _request(headers: dict[str, str] | None = None) -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/", "query_string": b"",
+                    "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]})
+
+
+class ConditionalResponseTest(unittest.TestCase):
+
+    def setUp(self):
+        with mock.patch.object(cache.config, "CONDITIONAL_GET_ENABLED", True):
+            @cache.conditional_response(max_age=5)
+            async def get_item(request: Request) -> Item:
+                return Item(id="x", last_modified=datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=PLUS_TWO))
+        self.get_item = get_item
+
+    def test_offset_last_modified(self):
+        response = asyncio.run(self.get_item(request=_request()))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Last-Modified"], "Thu, 02 Jan 2025 01:04:05 GMT")
+        self.assertEqual(response.headers["Cache-Control"], "max-age=5")
+
+    def test_not_modified(self):
+        etag = asyncio.run(self.get_item(request=_request())).headers["ETag"]
+        with self.assertRaises(HTTPException) as raised:
+            asyncio.run(self.get_item(request=_request({"If-None-Match": etag})))
+        self.assertEqual(raised.exception.status_code, 304)
+
+
+if __name__ == "__main__":
+    unittest.main()
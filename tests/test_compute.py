@@ -0,0 +1,60 @@
+"""Tests of the compute endpoints"""
+import json
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("IRI_SHOW_MISSING_ROUTES", "true")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.main import APP  # noqa: E402
+from app.routers.compute import compute, models  # noqa: E402
+
+HEADERS = {"Authorization": "12345"}
+
+
+class JobStatusesTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = TestClient(APP, raise_server_exceptions=False)
+        resources = cls.client.get("/api/v1/status/resources", params={"resource_type": "compute"}).json()
+        cls.url = f"/api/v1/compute/status/{resources[0]['id']}"
+
+    def get_jobs(self, jobs):
+        with mock.patch.object(compute.router.adapter, "get_jobs", mock.AsyncMock(return_value=jobs)):
+            return self.client.post(self.url, headers=HEADERS)
+
+    def test_models(self):
+        response = self.get_jobs([models.Job(id="1"), models.Job(id="2", status=models.JobStatus(state=models.JobState.QUEUED))])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [{"id": "1"}, {"id": "2", "status": {"state": "QUEUED"}}])
+
+    def test_dicts_are_validated(self):
+        response = self.get_jobs([{"id": "1", "status": {"state": models.JobState.QUEUED}}])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [{"id": "1", "status": {"state": "QUEUED"}}])
+
+    def test_invalid_jobs_are_rejected(self):
+        self.assertEqual(self.get_jobs([{"status": None}]).status_code, 500)
+
+
+class StreamJobStatusesTest(JobStatusesTest):
+    """The same jobs, streamed as ndjson (through the default iter_jobs, which yields from get_jobs)"""
+
+    def get_jobs(self, jobs):
+        with mock.patch.object(compute.router.adapter, "get_jobs", mock.AsyncMock(return_value=jobs)):
+            response = self.client.post(f"{self.url}/stream", headers=HEADERS)
+        if response.status_code == 200:
+            response.json = lambda: [json.loads(line) for line in response.text.splitlines()]
+        return response
+
+    def test_no_jobs(self):
+        response = self.get_jobs([])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "")
+
+
+if __name__ == "__main__":
+    unittest.main()
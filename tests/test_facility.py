@@ -0,0 +1,95 @@
+"""Tests of the facility endpoints' query parameter checks"""
+import os
+import unittest
+
+os.environ.setdefault("IRI_SHOW_MISSING_ROUTES", "true")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from pydantic import ValidationError  # noqa: E402
+
+from app.main import APP  # noqa: E402
+from app.routers.facility import models  # noqa: E402
+
+SINCE = "2025-01-01T00:00:00Z"
+
+
+class FacilityQueryParamsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = TestClient(APP)
+        cls.site_id = cls.client.get("/api/v1/facility/sites").json()[0]["id"]
+
+    def paths(self):
+        return ["/api/v1/facility", "/api/v1/facility/sites", f"/api/v1/facility/sites/{self.site_id}"]
+
+    def test_unknown_key(self):
+        for path in self.paths():
+            with self.subTest(path=path):
+                response = self.client.get(path, params={"bogus": "1"})
+                self.assertEqual(response.status_code, 422)
+                self.assertEqual(response.json()["detail"], "Unexpected query parameter: bogus")
+
+    def test_duplicate_key(self):
+        for path in self.paths():
+            with self.subTest(path=path):
+                response = self.client.get(f"{path}?modified_since={SINCE}&modified_since={SINCE}")
+                self.assertEqual(response.status_code, 422)
+                self.assertEqual(response.json()["detail"], "Duplicate query parameter: modified_since")
+
+    def test_unknown_key_before_invalid_value(self):
+        response = self.client.get("/api/v1/facility/sites", params={"bogus": "1", "limit": "-1"})
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json()["detail"], "Unexpected query parameter: bogus")
+
+    def test_invalid_value(self):
+        response = self.client.get("/api/v1/facility/sites", params={"limit": "-1"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_same_as_other_routers(self):
+        facility = self.client.get("/api/v1/facility/sites", params={"bogus": "1"}).json()
+        status = self.client.get("/api/v1/status/resources", params={"bogus": "1"}).json()
+        self.assertEqual({k: v for k, v in facility.items() if k != "instance"}, {k: v for k, v in status.items() if k != "instance"})
+
+    def test_allowed_keys(self):
+        response = self.client.get("/api/v1/facility/sites", params={"modified_since": SINCE, "name": "x", "offset": 0, "limit": 1, "short_name": "x"})
+        self.assertEqual(response.status_code, 200)
+
+
+class FacilityLinksTest(unittest.TestCase):
+
+    def test_support_uri_is_validated(self):
+        facility = TestClient(APP).get("/api/v1/facility").json()
+        # an HttpUrl, normalized, as supplied by the adapter
+        self.assertEqual(facility["support_uri"], "https://support.demo.example/")
+        with self.assertRaises(ValidationError):
+            models.Facility(id="x", name="x", last_modified=SINCE, support_uri="not a url")
+
+
+class LegacyLinksTest(unittest.TestCase):
+    """Adapters written before the links were computed pass the links themselves"""
+
+    def test_facility_site_uris(self):
+        facility = models.Facility(id="f", name="f", last_modified=SINCE,
+                                   site_uris=[f"https://elsewhere.example/api/v1/facility/sites/{s}" for s in ("a", "b")])
+        self.assertEqual(facility.site_ids, ["a", "b"])
+        self.assertTrue(facility.site_uris[1].endswith("/facility/sites/b"))
+        self.assertNotIn("site_uris", facility.__pydantic_extra__)
+
+    def test_site_resource_uris(self):
+        site = models.Site(id="s", name="s", last_modified=SINCE, operating_organization="o",
+                           resource_uris=["https://api.example/api/v1/status/resources/r1/"])
+        self.assertEqual(site.resource_ids, ["r1"])
+        self.assertEqual(site.model_dump()["resource_uris"], site.resource_uris)
+
+    def test_dump_round_trip(self):
+        site = models.Site(id="s", name="s", last_modified=SINCE, operating_organization="o", resource_ids=["r1", "r2"])
+        self.assertEqual(models.Site.model_validate(site.model_dump()).resource_ids, ["r1", "r2"])
+
+    def test_foreign_link(self):
+        with self.assertRaises(ValidationError):
+            models.Facility(id="f", name="f", last_modified=SINCE, site_uris=["https://elsewhere.example/projects/1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
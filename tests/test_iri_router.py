@@ -0,0 +1,55 @@
+"""Tests of the adapter lifecycle (app.routers.iri_router)"""
+import asyncio
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("IRI_SHOW_MISSING_ROUTES", "true")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app import main  # noqa: E402
+from app.routers.iri_router import IriRouter  # noqa: E402
+from app.routers.status import facility_adapter as status_adapter  # noqa: E402
+
+
+class StatusOnlyAdapter(status_adapter.FacilityAdapter):
+    """A status adapter that doesn't override close()."""
+    get_resources = get_resource = get_events = get_event = get_incidents = get_incident = None
+
+
+class ClosingAdapter(StatusOnlyAdapter):
+    def __init__(self, fails=False):
+        self.fails = fails
+        self.closed = False
+
+    async def close(self):
+        if self.fails:
+            raise RuntimeError("close failed")
+        self.closed = True
+
+
+class CloseAdaptersTest(unittest.TestCase):
+
+    def test_adapter_without_close_override(self):
+        with mock.patch.dict(IriRouter._adapters, {"StatusOnlyAdapter": StatusOnlyAdapter()}, clear=True):
+            asyncio.run(IriRouter.close_adapters())
+
+    def test_failing_adapter_doesnt_keep_the_others_open(self):
+        ok = ClosingAdapter()
+        with mock.patch.dict(IriRouter._adapters, {"failing": ClosingAdapter(fails=True), "ok": ok}, clear=True):
+            with self.assertLogs(level="ERROR") as logs:
+                asyncio.run(IriRouter.close_adapters())
+        self.assertTrue(ok.closed)
+        self.assertIn("failing", logs.output[0])
+
+    def test_shutdown_closes_the_cache(self):
+        with mock.patch.dict(IriRouter._adapters, {"failing": ClosingAdapter(fails=True)}, clear=True), \
+                mock.patch.object(main.RESPONSE_CACHE, "close", mock.AsyncMock()) as close_cache:
+            with self.assertLogs(level="ERROR"), TestClient(main.APP):
+                pass
+        close_cache.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
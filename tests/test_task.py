@@ -0,0 +1,67 @@
+"""Tests of the task adapter's on_task"""
+import asyncio
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("IRI_SHOW_MISSING_ROUTES", "true")
+
+from app.demo_adapter import DemoAdapter  # noqa: E402
+from app.routers.task import facility_adapter, models  # noqa: E402
+
+
+class OnTaskTimeoutTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        adapter = DemoAdapter()
+        cls.resource = adapter.resources[0]
+        cls.user = asyncio.run(adapter.get_user("gtorok", "12345", None))
+        cls.command = models.FileCommand(args={"path": "x"})
+
+    def on_task(self, file, timeout=10):
+        fs_adapter = facility_adapter._get_adapter("filesystem")
+        with mock.patch.object(fs_adapter, "file", file), mock.patch.dict(facility_adapter._FS_TIMEOUTS, {"file": timeout}):
+            return asyncio.run(facility_adapter.FacilityAdapter.on_task(self.resource, self.user, self.command))
+
+    def test_deadline(self):
+        async def hangs(*args, **kwargs):
+            await asyncio.sleep(10)
+        self.assertEqual(self.on_task(hangs, timeout=0.05), ("Error: file timed out after 0.05 seconds", models.TaskStatus.failed))
+
+    def test_adapter_timeout_is_not_the_deadline(self):
+        async def storage_timeout(*args, **kwargs):
+            raise TimeoutError("storage did not answer")
+        self.assertEqual(self.on_task(storage_timeout), ("Error: storage did not answer", models.TaskStatus.failed))
+
+    def test_cancellation_propagates(self):
+        async def hangs(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        async def cancel():
+            task = asyncio.ensure_future(facility_adapter.FacilityAdapter.on_task(self.resource, self.user, self.command))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            await task
+
+        fs_adapter = facility_adapter._get_adapter("filesystem")
+        with mock.patch.object(fs_adapter, "file", hangs):
+            with self.assertRaises(asyncio.CancelledError):
+                asyncio.run(cancel())
+
+
+class OnTaskArgsTest(unittest.TestCase):
+
+    def test_tail_gets_skip_heading(self):
+        adapter = DemoAdapter()
+        user = asyncio.run(adapter.get_user("gtorok", "12345", None))
+        command = models.TailCommand(args={"path": "x", "lines": 2, "skip_heading": True})
+        tail = mock.AsyncMock(return_value=mock.Mock(model_dump_json=lambda: "ok"))
+        with mock.patch.object(facility_adapter._get_adapter("filesystem"), "tail", tail):
+            result = asyncio.run(facility_adapter.FacilityAdapter.on_task(adapter.resources[0], user, command))
+        self.assertEqual(result, ("ok", models.TaskStatus.completed))
+        tail.assert_awaited_once_with(adapter.resources[0], user, path="x", file_bytes=None, lines=2, skip_heading=True)
+
+
+if __name__ == "__main__":
+    unittest.main()